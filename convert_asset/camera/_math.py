@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""Scalar camera-math kernels, JIT-compiled with numba when it is installed.
+
+numba is optional: without it ``njit_optional`` returns the function unchanged and the
+kernels run as plain Python. Kernels work on float tuples and caller-allocated arrays
+only (no numpy calls), so importing this module does not import numpy.
+"""
+from __future__ import annotations
+
+import math
+
+try:  # Optional JIT; plain Python when numba is absent
+    from numba import njit as _njit  # type: ignore
+except Exception:  # pragma: no cover
+    _njit = None
+
+HAVE_NUMBA = _njit is not None
+
+
+def njit_optional(fn):
+    """``numba.njit(cache=True, fastmath=True)`` when available, identity otherwise."""
+    return _njit(cache=True, fastmath=True)(fn) if _njit is not None else fn
+
+
+@njit_optional
+def cross(ax, ay, az, bx, by, bz):
+    return ay * bz - az * by, az * bx - ax * bz, ax * by - ay * bx
+
+
+@njit_optional
+def normalize(x, y, z, eps):
+    inv = 1.0 / max(math.sqrt(x * x + y * y + z * z), eps)
+    return x * inv, y * inv, z * inv
+
+
+@njit_optional
+def rodrigues(vx, vy, vz, kx, ky, kz, c, s):
+    """Rotate v about unit axis k: v c + (k x v) s + k (k.v)(1 - c)."""
+    cx, cy, cz = cross(kx, ky, kz, vx, vy, vz)
+    kd = (kx * vx + ky * vy + kz * vz) * (1.0 - c)
+    return vx * c + cx * s + kx * kd, vy * c + cy * s + ky * kd, vz * c + cz * s + kz * kd
+
+
+@njit_optional
+def write_matrix_rows(out, row, right, up, fwd, eye):
+    """Row-vector camera-to-world matrix (right, up, -fwd, eye) into ``out[row]``."""
+    for j in range(3):
+        out[row, 0, j] = right[j]
+        out[row, 1, j] = up[j]
+        out[row, 2, j] = -fwd[j]
+        out[row, 3, j] = eye[j]
+        out[row, j, 3] = 0.0
+    out[row, 3, 3] = 1.0
+
+
+@njit_optional
+def orbit_frame_matrices(out, base, up, origin, center, thetas, pitches, pitch_fallback, right_fallback):
+    """Fill ``out`` (P*S, 4, 4) with orbit frames, pitch-ring major, shot minor.
+
+    ``pitch_fallback`` is the pitch axis used where the azimuth vector is parallel to ``up``;
+    ``right_fallback`` is crossed with forward when forward is parallel to ``up``.
+    """
+    ux, uy, uz = up[0], up[1], up[2]
+    bx, by, bz = base[0], base[1], base[2]
+    kbx, kby, kbz = cross(ux, uy, uz, bx, by, bz)
+    k2x, k2y, k2z = cross(ux, uy, uz, kbx, kby, kbz)
+    n_shots = thetas.shape[0]
+    for i in range(n_shots):
+        c = math.cos(thetas[i])
+        s = math.sin(thetas[i])
+        rx = bx + s * kbx + (1.0 - c) * k2x
+        ry = by + s * kby + (1.0 - c) * k2y
+        rz = bz + s * kbz + (1.0 - c) * k2z
+        ax, ay, az = cross(ux, uy, uz, rx, ry, rz)
+        if math.sqrt(ax * ax + ay * ay + az * az) < 1.0e-6:
+            ax, ay, az = pitch_fallback[0], pitch_fallback[1], pitch_fallback[2]
+        else:
+            ax, ay, az = normalize(ax, ay, az, 1.0e-9)
+        for p in range(pitches.shape[0]):
+            pitch = pitches[p]
+            vx, vy, vz = rx, ry, rz
+            if abs(pitch) > 1.0e-6:
+                vx, vy, vz = rodrigues(rx, ry, rz, ax, ay, az, math.cos(pitch), math.sin(pitch))
+            ex, ey, ez = origin[0] + vx, origin[1] + vy, origin[2] + vz
+            fx, fy, fz = normalize(center[0] - ex, center[1] - ey, center[2] - ez, 1.0e-9)
+            qx, qy, qz = cross(fx, fy, fz, ux, uy, uz)
+            if math.sqrt(qx * qx + qy * qy + qz * qz) < 1.0e-6:
+                qx, qy, qz = cross(fx, fy, fz, right_fallback[0], right_fallback[1], right_fallback[2])
+            qx, qy, qz = normalize(qx, qy, qz, 1.0e-9)
+            wx, wy, wz = cross(qx, qy, qz, fx, fy, fz)
+            wx, wy, wz = normalize(wx, wy, wz, 1.0e-9)
+            write_matrix_rows(out, p * n_shots + i, (qx, qy, qz), (wx, wy, wz), (fx, fy, fz), (ex, ey, ez))
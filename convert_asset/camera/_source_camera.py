@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""Per-stage memo of the first source Camera found by traversal.
+
+Fit and orbit fall back to "the first Camera in traversal order" when no source
+camera path is given. Callers that keep one stage open and author many cameras
+would otherwise re-traverse the whole stage on every call. Entries are dropped on
+any composition resync; fit/orbit re-seed them after authoring their own camera.
+"""
+from __future__ import annotations
+
+import weakref
+from typing import Callable, Optional
+
+from pxr import Sdf, Tf, Usd  # type: ignore
+
+# stage -> {"callback", "listener", "found": {key: Optional[Sdf.Path]}}; Tf only holds the callback weakly
+_CACHE: "weakref.WeakKeyDictionary[Usd.Stage, dict]" = weakref.WeakKeyDictionary()
+
+
+def _entry(stage: Usd.Stage) -> dict:
+    entry = _CACHE.get(stage)
+    if entry is None:
+        stage_ref = weakref.ref(stage)
+
+        def _on_objects_changed(notice, sender):
+            owner = stage_ref()
+            if owner is None or not notice.GetResyncedPaths():
+                return
+            cached = _CACHE.get(owner)
+            if cached is not None:
+                cached["found"].clear()
+
+        entry = {
+            "callback": _on_objects_changed,
+            "listener": Tf.Notice.Register(Usd.Notice.ObjectsChanged, _on_objects_changed, stage),
+            "found": {},
+        }
+        _CACHE[stage] = entry
+    return entry
+
+
+def find_first_camera(
+    stage: Usd.Stage,
+    key: str = "",
+    accept: Optional[Callable[[Usd.Prim], bool]] = None,
+) -> Optional[Usd.Prim]:
+    """First Camera in traversal order passing ``accept``; memoized per (stage, key)."""
+    found = _entry(stage)["found"]
+    if key in found:
+        path = found[key]
+        return stage.GetPrimAtPath(path) if path is not None else None
+    first: Optional[Usd.Prim] = None
+    for prim in stage.Traverse():
+        if prim.GetTypeName() == "Camera" and (accept is None or accept(prim)):
+            first = prim
+            break
+    found[key] = first.GetPath() if first is not None else None
+    return first
+
+
+def _precedes(stage: Usd.Stage, a: Sdf.Path, b: Sdf.Path) -> bool:
+    """True if prim ``a`` is visited before prim ``b`` in a pre-order stage traversal."""
+    if b.HasPrefix(a):
+        return True
+    if a.HasPrefix(b):
+        return False
+    common = a.GetCommonPrefix(b)
+    depth = common.pathElementCount
+    a_child = a.GetPrefixes()[depth].name
+    b_child = b.GetPrefixes()[depth].name
+    names = list(stage.GetPrimAtPath(common).GetAllChildrenNames())
+    return names.index(a_child) < names.index(b_child)
+
+
+def remember_authored_camera(
+    stage: Usd.Stage,
+    key: str,
+    previous: Optional[Usd.Prim],
+    new_path: str,
+    eligible: bool,
+) -> None:
+    """Re-seed the memo after a caller defined ``new_path`` (its own edit cleared the entry)."""
+    first: Optional[Sdf.Path] = previous.GetPath() if previous is not None else None
+    if eligible:
+        new_sdf = Sdf.Path(new_path)
+        if first is None or _precedes(stage, new_sdf, first):
+            first = new_sdf
+    _entry(stage)["found"][key] = first
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""Prim-path helpers shared by camera fit and orbit.
+
+pxr is imported inside the functions, so orbit's module import stays cheap.
+"""
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pxr import Sdf, Usd  # type: ignore
+
+
+@functools.lru_cache(maxsize=1024)
+def sdf_path(path: str) -> "Sdf.Path":
+    """Parsed Sdf.Path for a path string; Sdf.Path is immutable so sharing is safe."""
+    from pxr import Sdf  # type: ignore
+
+    return Sdf.Path(path)
+
+
+def unique_camera_path(stage: "Usd.Stage", basename: str) -> str:
+    """``basename`` or the first free ``basename_<i>``, from one scan of the parent's child names."""
+    base = sdf_path(basename)
+    parent = stage.GetPrimAtPath(base.GetParentPath())
+    # GetAllChildrenNames also lists inactive/undefined (over) children, which Define would collide with.
+    taken = set(parent.GetAllChildrenNames()) if parent else set()
+    name = base.name
+    i = 1
+    while name in taken:
+        name = f"{base.name}_{i}"
+        i += 1
+    return base.GetParentPath().AppendChild(name).pathString
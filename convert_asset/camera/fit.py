@@ -12,7 +12,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Optional, Tuple
 import math
-from pxr import Usd, UsdGeom, Gf, Sdf  # type: ignore
+from pxr import Usd, UsdGeom, Gf  # type: ignore
+
+from ._math import njit_optional
+from ._source_camera import find_first_camera, remember_authored_camera
+from ._stage_paths import sdf_path, unique_camera_path
 
 
 @dataclass
@@ -47,37 +51,95 @@ class FitResult:
 
 
 def _normalize(v: Gf.Vec3d) -> Gf.Vec3d:
-    try:
-        return v.GetNormalized()
-    except Exception:
-        L = v.GetLength()
-        return v / max(L, 1e-9)
+    x, y, z = v[0], v[1], v[2]
+    inv = 1.0 / math.sqrt(x * x + y * y + z * z + 1e-30)
+    return Gf.Vec3d(x * inv, y * inv, z * inv)
 
 
-def _bbox_world_range(prim: Usd.Prim):
+def make_bbox_cache() -> UsdGeom.BBoxCache:
+    """BBoxCache matching the framing purposes; reuse one across calls on the same stage."""
     purposes = [UsdGeom.Tokens.default_, UsdGeom.Tokens.render, UsdGeom.Tokens.proxy]
-    cache = UsdGeom.BBoxCache(Usd.TimeCode.Default(), purposes, useExtentsHint=True)
+    return UsdGeom.BBoxCache(Usd.TimeCode.Default(), purposes, useExtentsHint=True)
+
+
+def _bbox_world_range(prim: Usd.Prim, cache: Optional[UsdGeom.BBoxCache] = None):
+    if cache is None:
+        cache = make_bbox_cache()
     return cache.ComputeWorldBound(prim).ComputeAlignedRange()
 
 
-def _world_basis_from_camera_prim(cam_prim: Usd.Prim):
-    """Camera local axes: +X=right, +Y=up, -Z=forward."""
-    xc = UsdGeom.XformCache(Usd.TimeCode.Default())
+def _world_basis_from_camera_prim(cam_prim: Usd.Prim, xc: Optional[UsdGeom.XformCache] = None):
+    """Camera local axes: +X=right, +Y=up, -Z=forward.
+
+    Gf matrices are row-vector convention, so the upper-left 3x3 rows of the
+    local-to-world matrix already are the world-space axes. Pass ``xc`` to share
+    one XformCache across several prims.
+    """
+    if xc is None:
+        xc = UsdGeom.XformCache(Usd.TimeCode.Default())
     M = xc.GetLocalToWorldTransform(cam_prim)
-    right = _normalize(M.TransformDir(Gf.Vec3d(1, 0, 0)))
-    up = _normalize(M.TransformDir(Gf.Vec3d(0, 1, 0)))
-    fwd = _normalize(M.TransformDir(Gf.Vec3d(0, 0, -1)))
+    right = _normalize(M.GetRow3(0))
+    up = _normalize(M.GetRow3(1))
+    fwd = _normalize(-M.GetRow3(2))
     return right, up, fwd
 
 
-def _rotate_vec_around_axis(v: Gf.Vec3d, axis_unit: Gf.Vec3d, ang_rad: float) -> Gf.Vec3d:
-    # Rodrigues
-    c, s = math.cos(ang_rad), math.sin(ang_rad)
-    return v * c + Gf.Cross(axis_unit, v) * s + axis_unit * Gf.Dot(axis_unit, v) * (1.0 - c)
+@njit_optional
+def _fit_math(src_right, src_up, src_fwd, size_xyz, pitch_rad, fov_h, aspect, padding, backoff):
+    """Pitch tweak, orthonormalization and frame fit on plain float 3-tuples.
+
+    Returns ``(adj_right, adj_up, adj_fwd, distance, fov_v)`` with the vectors as 3-tuples.
+    Scalar-only so numba can compile it; no Gf objects on this path.
+    """
+    # Rodrigues about the unit right axis: v' = v cos + (k x v) sin + k (k.v)(1 - cos)
+    kx, ky, kz = src_right[0], src_right[1], src_right[2]
+    inv = 1.0 / math.sqrt(kx * kx + ky * ky + kz * kz + 1e-30)
+    kx, ky, kz = kx * inv, ky * inv, kz * inv
+    c = math.cos(pitch_rad)
+    s = math.sin(pitch_rad)
+    fx, fy, fz = src_fwd[0], src_fwd[1], src_fwd[2]
+    kd = (kx * fx + ky * fy + kz * fz) * (1.0 - c)
+    fx, fy, fz = (
+        fx * c + (ky * fz - kz * fy) * s + kx * kd,
+        fy * c + (kz * fx - kx * fz) * s + ky * kd,
+        fz * c + (kx * fy - ky * fx) * s + kz * kd,
+    )
+    ux, uy, uz = src_up[0], src_up[1], src_up[2]
+    kd = (kx * ux + ky * uy + kz * uz) * (1.0 - c)
+    ux, uy, uz = (
+        ux * c + (ky * uz - kz * uy) * s + kx * kd,
+        uy * c + (kz * ux - kx * uz) * s + ky * kd,
+        uz * c + (kx * uy - ky * ux) * s + kz * kd,
+    )
+
+    # Orthonormalize: fwd, right = fwd x up, up = right x fwd
+    inv = 1.0 / math.sqrt(fx * fx + fy * fy + fz * fz + 1e-30)
+    fx, fy, fz = fx * inv, fy * inv, fz * inv
+    rx, ry, rz = fy * uz - fz * uy, fz * ux - fx * uz, fx * uy - fy * ux
+    inv = 1.0 / math.sqrt(rx * rx + ry * ry + rz * rz + 1e-30)
+    rx, ry, rz = rx * inv, ry * inv, rz * inv
+    ux, uy, uz = ry * fz - rz * fy, rz * fx - rx * fz, rx * fy - ry * fx
+    inv = 1.0 / math.sqrt(ux * ux + uy * uy + uz * uz + 1e-30)
+    ux, uy, uz = ux * inv, uy * inv, uz * inv
+
+    # Extreme bbox-corner projection: max over sign combos of |sum s_i h_i a_i| = sum h_i |a_i|
+    # Half extents, clamped so flat bboxes still frame
+    hx = max(size_xyz[0], 1e-6) * 0.5
+    hy = max(size_xyz[1], 1e-6) * 0.5
+    hz = max(size_xyz[2], 1e-6) * 0.5
+    w_half = hx * abs(rx) + hy * abs(ry) + hz * abs(rz)
+    h_half = hx * abs(ux) + hy * abs(uy) + hz * abs(uz)
+
+    tan_h = math.tan(fov_h / 2.0)
+    fov_v = 2.0 * math.atan(max(1e-9, tan_h) / max(aspect, 1e-9))
+    dist_h = w_half / max(tan_h, 1e-9)
+    dist_v = h_half / max(math.tan(fov_v / 2.0), 1e-9)
+    distance = max(dist_h, dist_v) * padding * backoff
+    return (rx, ry, rz), (ux, uy, uz), (fx, fy, fz), distance, fov_v
 
 
 def _length_diag(v3: Gf.Vec3d) -> float:
-    return float((v3[0] * v3[0] + v3[1] * v3[1] + v3[2] * v3[2]) ** 0.5)
+    return math.hypot(v3[0], v3[1], v3[2])
 
 
 def _compute_height_offset_units(mode: str, value: float, size_vec: Gf.Vec3d) -> float:
@@ -95,98 +157,92 @@ def _compute_height_offset_units(mode: str, value: float, size_vec: Gf.Vec3d) ->
 
 
 def _build_world_matrix_rows(right: Gf.Vec3d, up: Gf.Vec3d, forward: Gf.Vec3d, eye: Gf.Vec3d) -> Gf.Matrix4d:
-    m = Gf.Matrix4d(1.0)
-    back = -forward
-    m.SetRow(0, Gf.Vec4d(right[0], right[1], right[2], 0.0))
-    m.SetRow(1, Gf.Vec4d(up[0], up[1], up[2], 0.0))
-    m.SetRow(2, Gf.Vec4d(back[0], back[1], back[2], 0.0))
-    m.SetRow(3, Gf.Vec4d(eye[0], eye[1], eye[2], 1.0))
-    return m
+    # Row-vector convention: rows are right, up, back (-forward), translation; one 16-arg constructor.
+    return Gf.Matrix4d(
+        right[0], right[1], right[2], 0.0,
+        up[0], up[1], up[2], 0.0,
+        -forward[0], -forward[1], -forward[2], 0.0,
+        eye[0], eye[1], eye[2], 1.0,
+    )
 
 
-def fit_camera_and_export(src_usd_path: str, out_usd_path: str, params: FitParams) -> FitResult:
-    stage = Usd.Stage.Open(src_usd_path)
+def fit_camera_and_export(
+    src_usd_path: str,
+    out_usd_path: str,
+    params: FitParams,
+    *,
+    bbox_cache: Optional[UsdGeom.BBoxCache] = None,
+    stage: Optional[Usd.Stage] = None,
+) -> FitResult:
+    """Frame ``params.target_prim_path`` with a new camera and export the stage.
+
+    ``bbox_cache`` (see ``make_bbox_cache``) may be shared across calls on the same stage
+    so extents hints and xform sub-caches are not rebuilt per call.
+    Pass an already-open ``stage`` to skip re-opening ``src_usd_path``; the camera is then
+    authored into that stage (visible to later calls) before exporting.
+    """
+    if stage is None:
+        stage = Usd.Stage.Open(src_usd_path)
     if stage is None:
         raise RuntimeError(f"Failed to open stage: {src_usd_path}")
 
-    target_prim = stage.GetPrimAtPath(Sdf.Path(params.target_prim_path))
+    target_prim = stage.GetPrimAtPath(sdf_path(params.target_prim_path))
     if not target_prim or not target_prim.IsValid():
         raise RuntimeError(f"Target prim not found: {params.target_prim_path}")
 
     # Source camera
     src_cam_prim: Optional[Usd.Prim] = None
     if params.source_camera_path:
-        p = Sdf.Path(params.source_camera_path)
+        p = sdf_path(params.source_camera_path)
         prim = stage.GetPrimAtPath(p)
         if prim and prim.IsValid() and prim.GetTypeName() == "Camera":
             src_cam_prim = prim
         else:
             raise RuntimeError(f"Source camera prim not found or not a Camera: {params.source_camera_path}")
     else:
-        # Try to find any camera in the stage
-        for prim in stage.Traverse():
-            if prim.GetTypeName() == "Camera":
-                src_cam_prim = prim
-                break
-        if src_cam_prim is None:
-            # Fall back to world-forward basis
-            world_right = Gf.Vec3d(1, 0, 0)
-            world_up = Gf.Vec3d(0, 0, 1)
-            world_fwd = Gf.Vec3d(0, 1, 0)  # arbitrary; Z-up world => forward=+Y
-            src_right, src_up, src_fwd = world_right, world_up, world_fwd
-        else:
-            src_right, src_up, src_fwd = _world_basis_from_camera_prim(src_cam_prim)
-
-    if src_cam_prim is not None:
+        # Try to find any camera in the stage (memoized per open stage)
+        src_cam_prim = find_first_camera(stage)
+
+    # One basis extraction for either source (explicit path or first camera found)
+    if src_cam_prim is None:
+        # Fall back to world-forward basis
+        world_right = Gf.Vec3d(1, 0, 0)
+        world_up = Gf.Vec3d(0, 0, 1)
+        world_fwd = Gf.Vec3d(0, 1, 0)  # arbitrary; Z-up world => forward=+Y
+        src_right, src_up, src_fwd = world_right, world_up, world_fwd
+    else:
         src_right, src_up, src_fwd = _world_basis_from_camera_prim(src_cam_prim)
 
     # Target bbox
-    rng = _bbox_world_range(target_prim)
+    rng = _bbox_world_range(target_prim, bbox_cache)
     if rng.IsEmpty():
         raise RuntimeError(f"Empty bbox for prim: {params.target_prim_path}")
-    mn, mx = rng.GetMin(), rng.GetMax()
-    center = (mn + mx) * 0.5
-    size = mx - mn
-    half = Gf.Vec3d(max(size[0], 1e-6) / 2.0, max(size[1], 1e-6) / 2.0, max(size[2], 1e-6) / 2.0)
-
-    # Pitch tweak around right axis
-    pitch_rad = math.radians(params.pitch_down_deg)
-    right_unit = _normalize(src_right)
-    adj_fwd = _rotate_vec_around_axis(src_fwd, right_unit, pitch_rad)
-    adj_up = _rotate_vec_around_axis(src_up, right_unit, pitch_rad)
-    # Orthonormalize
-    adj_fwd = _normalize(adj_fwd)
-    adj_right = _normalize(Gf.Cross(adj_fwd, adj_up))
-    adj_up = _normalize(Gf.Cross(adj_right, adj_fwd))
-
-    # Frame fit
-    hx, hy, hz = float(half[0]), float(half[1]), float(half[2])
-    corners = [Gf.Vec3d(sx * hx, sy * hy, sz * hz) for sx in (-1, 1) for sy in (-1, 1) for sz in (-1, 1)]
-    w_half = 0.0
-    h_half = 0.0
-    for v in corners:
-        w_half = max(w_half, abs(Gf.Dot(v, adj_right)))
-        h_half = max(h_half, abs(Gf.Dot(v, adj_up)))
+    center = rng.GetMidpoint()
+    size = rng.GetSize()
 
+    # Pitch tweak, orthonormalization and frame fit (numba-compiled when available)
     aspect = float(params.aspect)
     fov_h = math.radians(params.fov_h_deg)
-    fov_v = 2.0 * math.atan(max(1e-9, math.tan(fov_h / 2.0)) / max(aspect, 1e-9))
-    dist_h = w_half / max(math.tan(fov_h / 2.0), 1e-9)
-    dist_v = h_half / max(math.tan(fov_v / 2.0), 1e-9)
-    distance = max(dist_h, dist_v) * float(params.padding) * float(params.backoff)
+    r, u, f, distance, fov_v = _fit_math(
+        (src_right[0], src_right[1], src_right[2]),
+        (src_up[0], src_up[1], src_up[2]),
+        (src_fwd[0], src_fwd[1], src_fwd[2]),
+        (size[0], size[1], size[2]),
+        math.radians(params.pitch_down_deg),
+        fov_h,
+        aspect,
+        float(params.padding),
+        float(params.backoff),
+    )
+    adj_right, adj_up, adj_fwd = Gf.Vec3d(*r), Gf.Vec3d(*u), Gf.Vec3d(*f)
 
     # Height offset
     height_units = _compute_height_offset_units(params.height_offset_mode, params.height_offset_value, size)
     eye = Gf.Vec3d(center) - adj_fwd * distance + adj_up * height_units
 
     # Create camera prim path
-    cam_path = params.camera_basename
-    if stage.GetPrimAtPath(cam_path):
-        i = 1
-        while stage.GetPrimAtPath(f"{params.camera_basename}_{i}"):
-            i += 1
-        cam_path = f"{params.camera_basename}_{i}"
-    new_cam = UsdGeom.Camera.Define(stage, Sdf.Path(cam_path))
+    cam_path = unique_camera_path(stage, params.camera_basename)
+    new_cam = UsdGeom.Camera.Define(stage, sdf_path(cam_path))
 
     # Intrinsics from FOV + focal
     H_APERTURE_MM = 2.0 * float(params.focal_mm) * math.tan(fov_h / 2.0)
@@ -201,6 +257,9 @@ def fit_camera_and_export(src_usd_path: str, out_usd_path: str, params: FitParam
     ops = xf.GetOrderedXformOps()
     xop = ops[0] if (ops and ops[0].GetOpType() == UsdGeom.XformOp.TypeTransform) else xf.AddTransformOp()
     xop.Set(M)
+    if not params.source_camera_path:
+        # Our own Define resynced the stage; re-seed the memo instead of re-traversing next time
+        remember_authored_camera(stage, "", src_cam_prim, cam_path, True)
 
     # Export to new usd
     stage.Export(out_usd_path)
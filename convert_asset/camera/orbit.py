@@ -2,9 +2,29 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional
+import functools
+import itertools
+from typing import TYPE_CHECKING, Optional
 import math
-from pxr import Usd, UsdGeom, Gf, Sdf, UsdLux  # type: ignore
+
+from ._stage_paths import sdf_path, unique_camera_path
+
+# pxr and numpy are imported inside the functions that use them, so importing this module stays cheap.
+if TYPE_CHECKING:  # pragma: no cover
+    import numpy as np
+    from pxr import Usd, UsdGeom, Gf, Sdf  # type: ignore
+
+_np_mod = None
+
+
+def _np():
+    """numpy, imported on first use so importing this module stays cheap."""
+    global _np_mod
+    if _np_mod is None:
+        import numpy
+
+        _np_mod = numpy
+    return _np_mod
 
 
 @dataclass
@@ -25,36 +45,47 @@ class OrbitParams:
     fallback_focal_mm: float = 35.0
     fallback_near_clip: float = 0.01
     fallback_far_clip: float = 10000.0
+    # Per-frame xform authoring: translate_orient (double3 + quatf, ~56 B/sample) | transform (4x4, 128 B)
+    xform_op_mode: str = "translate_orient"
 
 
 def _normalize(v: Gf.Vec3d) -> Gf.Vec3d:
-    try:
-        return v.GetNormalized()
-    except Exception:
-        L = v.GetLength()
-        return v / max(L, 1e-9)
+    from pxr import Gf  # type: ignore
+
+    x, y, z = v[0], v[1], v[2]
+    inv = 1.0 / math.sqrt(x * x + y * y + z * z + 1e-30)
+    return Gf.Vec3d(x * inv, y * inv, z * inv)
+
+
+def _normalized_cross(a: Gf.Vec3d, b: Gf.Vec3d) -> Gf.Vec3d:
+    """Unit ``a x b`` with a single reciprocal sqrt (direction only, so ``b`` need not be unit)."""
+    from pxr import Gf  # type: ignore
+
+    c = Gf.Cross(a, b)
+    inv = 1.0 / math.sqrt(c[0] * c[0] + c[1] * c[1] + c[2] * c[2] + 1e-30)
+    return Gf.Vec3d(c[0] * inv, c[1] * inv, c[2] * inv)
 
 
 def _world_up(stage: Usd.Stage) -> Gf.Vec3d:
+    from pxr import Gf, UsdGeom  # type: ignore
+
     return Gf.Vec3d(0, 0, 1) if UsdGeom.GetStageUpAxis(stage) == UsdGeom.Tokens.z else Gf.Vec3d(0, 1, 0)
 
 
+# Path substrings marking environment shells that should not distort the orbit radius.
+_BBOX_IGNORE_SUBSTRINGS = ("__default_setting", "skydome", "environment")
+_DOME_LIGHT_TYPES = frozenset(("DomeLight", "DomeLight_1"))
+
+
 def _should_ignore_for_bbox(node: Usd.Prim) -> bool:
     # Filter out common environment shells and dome lights so they do not distort the orbit radius.
     path_token = node.GetPath().pathString.lower()
-    if "__default_setting" in path_token:
+    if any(token in path_token for token in _BBOX_IGNORE_SUBSTRINGS):
         return True
     if "hdr" in path_token and "sphere" in path_token:
         return True
-    if "skydome" in path_token or "environment" in path_token:
-        return True
-    try:
-        dome = UsdLux.DomeLight(node)
-        if dome and dome.GetPrim().IsValid():
-            return True
-    except Exception:
-        pass
-    return False
+    # Type-name compare instead of constructing a UsdLux.DomeLight schema per prim.
+    return node.GetTypeName() in _DOME_LIGHT_TYPES
 
 
 def _is_viewer_observer_camera(prim: Usd.Prim, orbit_basename: str) -> bool:
@@ -73,17 +104,27 @@ def _is_viewer_observer_camera(prim: Usd.Prim, orbit_basename: str) -> bool:
     return False
 
 
-def _bbox_center_and_size(stage: Usd.Stage, path: str):
-    prim = stage.GetPrimAtPath(Sdf.Path(path))
-    if not prim or not prim.IsValid():
-        raise RuntimeError(f"Target prim not found: {path}")
+def make_bbox_cache() -> UsdGeom.BBoxCache:
+    """BBoxCache matching the orbit purposes; reuse one across calls on the same stage."""
+    from pxr import Usd, UsdGeom  # type: ignore
 
-    cache = UsdGeom.BBoxCache(
+    return UsdGeom.BBoxCache(
         Usd.TimeCode.Default(),
         [UsdGeom.Tokens.default_, UsdGeom.Tokens.render, UsdGeom.Tokens.proxy],
         useExtentsHint=True,
     )
 
+
+def _bbox_center_and_size(stage: Usd.Stage, path: str, cache: Optional[UsdGeom.BBoxCache] = None):
+    from pxr import Gf, Usd, UsdGeom  # type: ignore
+
+    prim = stage.GetPrimAtPath(sdf_path(path))
+    if not prim or not prim.IsValid():
+        raise RuntimeError(f"Target prim not found: {path}")
+
+    if cache is None:
+        cache = make_bbox_cache()
+
     def _range_is_sane(rng: Gf.Range3d) -> bool:
         if rng.IsEmpty():
             return False
@@ -91,7 +132,7 @@ def _bbox_center_and_size(stage: Usd.Stage, path: str):
         vals = [mn[0], mn[1], mn[2], mx[0], mx[1], mx[2]]
         if not all(math.isfinite(v) for v in vals):
             return False
-        diag = (mx - mn).GetLength()
+        diag = rng.GetSize().GetLength()
         if not math.isfinite(diag) or diag <= 0:
             return False
         # Guard against pathological extents coming from bad extents hints.
@@ -101,86 +142,66 @@ def _bbox_center_and_size(stage: Usd.Stage, path: str):
     top_center: Optional[Gf.Vec3d] = None
     top_size: Optional[Gf.Vec3d] = None
     if _range_is_sane(rng):
-        mn, mx = rng.GetMin(), rng.GetMax()
-        top_center = (mn + mx) * 0.5
-        top_size = (mx - mn)
+        top_center = rng.GetMidpoint()
+        top_size = rng.GetSize()
 
     # Aggregate finite child bounds while rejecting outliers and environment shells.
-    bounds = []
-    stack = [prim]
-    while stack:
-        node = stack.pop()
-        if not node or not node.IsValid():
-            continue
+    min_rows = []
+    max_rows = []
+    root_path = prim.GetPath()
+    it = iter(Usd.PrimRange(prim))
+    for node in it:
         if _should_ignore_for_bbox(node):
+            it.PruneChildren()
             continue
-        stack.extend(list(node.GetChildren()))
         if not node.IsA(UsdGeom.Imageable):
             continue
-        local_rng = cache.ComputeWorldBound(node).ComputeAlignedRange()
+        # The root's bound was computed above; don't ask the cache again.
+        local_rng = rng if node.GetPath() == root_path else cache.ComputeWorldBound(node).ComputeAlignedRange()
         if local_rng.IsEmpty():
             continue
         local_min, local_max = local_rng.GetMin(), local_rng.GetMax()
-        vals = [
-            local_min[0],
-            local_min[1],
-            local_min[2],
-            local_max[0],
-            local_max[1],
-            local_max[2],
-        ]
-        if not all(math.isfinite(v) for v in vals):
-            continue
-        diag = (local_max - local_min).GetLength()
-        if not math.isfinite(diag) or diag <= 0:
-            continue
-        if diag > 1.0e9:
-            continue
-        bounds.append((diag, local_min, local_max))
-
-    if not bounds:
+        min_rows.append((local_min[0], local_min[1], local_min[2]))
+        max_rows.append((local_max[0], local_max[1], local_max[2]))
+
+    # Reject non-finite, degenerate and pathological (> 1e9 diagonal) child bounds in one pass.
+    np = _np()
+    mins_arr = np.asarray(min_rows, dtype=np.float64).reshape(-1, 3)
+    maxs_arr = np.asarray(max_rows, dtype=np.float64).reshape(-1, 3)
+    finite = np.isfinite(mins_arr).all(axis=1) & np.isfinite(maxs_arr).all(axis=1)
+    mins_arr, maxs_arr = mins_arr[finite], maxs_arr[finite]
+    diags = np.linalg.norm(maxs_arr - mins_arr, axis=1)
+    keep = np.isfinite(diags) & (diags > 0) & (diags <= 1.0e9)
+    mins_arr, maxs_arr, diags = mins_arr[keep], maxs_arr[keep], diags[keep]
+
+    if diags.size == 0:
         if top_center is not None and top_size is not None:
             return top_center, top_size
         raise RuntimeError(f"Failed to compute finite bbox for prim: {path}")
 
-    if len(bounds) > 1:
-        diags = sorted(item[0] for item in bounds)
-        typical = diags[len(diags) // 2]
+    if diags.size > 1:
+        mid = diags.size // 2
+        typical = float(np.partition(diags, mid)[mid])  # upper median, O(M) selection
         if math.isfinite(typical) and typical > 0.0:
             limit = max(typical * 20.0, typical + 10.0)
-            filtered = [item for item in bounds if item[0] <= limit]
-            if filtered:
-                bounds = filtered
-
-    mins = [math.inf, math.inf, math.inf]
-    maxs = [-math.inf, -math.inf, -math.inf]
-    for _, mn, mx in bounds:
-        mins[0] = min(mins[0], mn[0])
-        mins[1] = min(mins[1], mn[1])
-        mins[2] = min(mins[2], mn[2])
-        maxs[0] = max(maxs[0], mx[0])
-        maxs[1] = max(maxs[1], mx[1])
-        maxs[2] = max(maxs[2], mx[2])
-
-    if not all(math.isfinite(v) for v in mins + maxs):
+            within = diags <= limit
+            if within.any():
+                mins_arr, maxs_arr = mins_arr[within], maxs_arr[within]
+
+    agg_min = mins_arr.min(axis=0)
+    agg_max = maxs_arr.max(axis=0)
+    if not (np.isfinite(agg_min).all() and np.isfinite(agg_max).all()):
         raise RuntimeError(f"Non-finite bbox extrema for prim: {path}")
 
-    mn = Gf.Vec3d(*mins)
-    mx = Gf.Vec3d(*maxs)
-    agg_center = (mn + mx) * 0.5
-    agg_size = (mx - mn)
+    agg_rng = Gf.Range3d(Gf.Vec3d(*agg_min.tolist()), Gf.Vec3d(*agg_max.tolist()))
+    agg_center = agg_rng.GetMidpoint()
+    agg_size = agg_rng.GetSize()
 
     if top_center is None or top_size is None:
         return agg_center, agg_size
 
-    try:
-        diag_top = float(top_size.GetLength())
-    except Exception:
-        diag_top = math.sqrt(top_size[0] ** 2 + top_size[1] ** 2 + top_size[2] ** 2)
-    try:
-        diag_agg = float(agg_size.GetLength())
-    except Exception:
-        diag_agg = math.sqrt(agg_size[0] ** 2 + agg_size[1] ** 2 + agg_size[2] ** 2)
+    diag_top = top_size.GetLength()
+    diag_agg = agg_size.GetLength()
 
     if not math.isfinite(diag_top) or diag_top <= 0:
         return agg_center, agg_size
@@ -190,64 +211,230 @@ def _bbox_center_and_size(stage: Usd.Stage, path: str):
     return top_center, top_size
 
 
-def _rotate_vec(v: Gf.Vec3d, axis_unit: Gf.Vec3d, ang_rad: float) -> Gf.Vec3d:
-    c, s = math.cos(ang_rad), math.sin(ang_rad)
-    return v * c + Gf.Cross(axis_unit, v) * s + axis_unit * Gf.Dot(axis_unit, v) * (1.0 - c)
+@functools.lru_cache(maxsize=1)
+def _corner_signs() -> np.ndarray:
+    """(8, 3) sign patterns of the unit box corners; built once on first use (numpy is lazy here)."""
+    np = _np()
+    signs = np.array(list(itertools.product((-1.0, 1.0), repeat=3)), dtype=np.float64)
+    signs.flags.writeable = False
+    return signs
+
+
+def _as_np(v: Gf.Vec3d) -> np.ndarray:
+    np = _np()
+    return np.array([v[0], v[1], v[2]], dtype=np.float64)
+
+
+def _normalize_rows(v: np.ndarray) -> np.ndarray:
+    np = _np()
+    return v / np.maximum(np.linalg.norm(v, axis=-1, keepdims=True), 1e-9)
+
+
+def _rotate_rows(v: np.ndarray, axis_unit: np.ndarray, c, s) -> np.ndarray:
+    """Batched Rodrigues: v*c + (k x v)*s + k*(k.v)*(1-c); ``c``/``s`` broadcast against rows."""
+    np = _np()
+    c = np.asarray(c, dtype=np.float64)[..., None]
+    s = np.asarray(s, dtype=np.float64)[..., None]
+    k_dot_v = np.sum(axis_unit * v, axis=-1, keepdims=True)
+    return v * c + np.cross(axis_unit, v) * s + axis_unit * k_dot_v * (1.0 - c)
+
+
+def _sweep_about_up(v: np.ndarray, up: np.ndarray, cos_t: np.ndarray, sin_t: np.ndarray) -> np.ndarray:
+    """Rotate rows ``v`` (P, 3) about unit ``up`` by every azimuth; returns (P, S, 3)."""
+    np = _np()
+    k = int(np.argmax(np.abs(up)))
+    if abs(up[k]) == 1.0:
+        # Axis-aligned up (the stage up axis): the up component is invariant, so this is a
+        # planar rotation of the other two, with (i, j, k) cyclic and the sign of up folded into sin.
+        i, j = (k + 1) % 3, (k + 2) % 3
+        s = sin_t * up[k]
+        out = np.empty((v.shape[0], cos_t.shape[0], 3), dtype=np.float64)
+        vi, vj = v[:, i, None], v[:, j, None]
+        out[..., i] = cos_t * vi - s * vj
+        out[..., j] = s * vi + cos_t * vj
+        out[..., k] = v[:, k, None]
+        return out
+    # General up: v + sin K v + (1 - cos) K^2 v with K = skew(up), K v / K^2 v hoisted per row.
+    kv = np.cross(up, v)
+    k2v = np.cross(up, kv)
+    return (
+        v[:, None, :]
+        + sin_t[None, :, None] * kv[:, None, :]
+        + (1.0 - cos_t)[None, :, None] * k2v[:, None, :]
+    )
 
 
-def _build_world_matrix_rows(right: Gf.Vec3d, up: Gf.Vec3d, forward: Gf.Vec3d, eye: Gf.Vec3d) -> Gf.Matrix4d:
-    m = Gf.Matrix4d(1.0)
-    back = -forward
-    m.SetRow(0, Gf.Vec4d(right[0], right[1], right[2], 0.0))
-    m.SetRow(1, Gf.Vec4d(up[0], up[1], up[2], 0.0))
-    m.SetRow(2, Gf.Vec4d(back[0], back[1], back[2], 0.0))
-    m.SetRow(3, Gf.Vec4d(eye[0], eye[1], eye[2], 1.0))
-    return m
+def _orbit_frame_matrices(
+    base_vec: Gf.Vec3d,
+    world_up: Gf.Vec3d,
+    orbit_origin: Gf.Vec3d,
+    center: Gf.Vec3d,
+    thetas: np.ndarray,
+    pitch_angles: list,
+) -> np.ndarray:
+    """Row-vector camera-to-world matrices for every (pitch ring, shot), shape (P*S, 4, 4)."""
+    from pxr import Gf  # type: ignore
+
+    from . import _math
+
+    np = _np()
+
+    if _math.HAVE_NUMBA:
+        # Compiled loop kernel; the NumPy path below is the reference when numba is missing.
+        up0 = _as_np(world_up)
+        mats = np.empty((len(pitch_angles) * len(thetas), 4, 4), dtype=np.float64)
+        _math.orbit_frame_matrices(
+            mats,
+            _as_np(base_vec),
+            up0,
+            _as_np(orbit_origin),
+            _as_np(center),
+            np.asarray(thetas, dtype=np.float64),
+            np.asarray(pitch_angles, dtype=np.float64),
+            _as_np(_normalize(_perpendicular_right(world_up))),
+            np.array([1.0, 0.0, 0.0]) if abs(up0[0]) < 0.9 else np.array([0.0, 1.0, 0.0]),
+        )
+        return mats
+
+    up = _as_np(world_up)
+    base = _as_np(base_vec)
+    thetas = np.asarray(thetas, dtype=np.float64)
+    cos_t = np.cos(thetas)
+    sin_t = np.sin(thetas)
+    # One cos/sin table for all rings; flat rings rotate by (c=1, s=0), i.e. stay exactly on the sweep.
+    pitches = np.asarray(pitch_angles, dtype=np.float64)
+    active = np.abs(pitches) > 1.0e-6
+    cp = np.where(active, np.cos(pitches), 1.0)
+    sp = np.where(active, np.sin(pitches), 0.0)
+    a0 = np.cross(up, base)
+
+    if active.any() and np.linalg.norm(a0) >= 1.0e-6:
+        # The pitch axis at theta is R_az(theta) a0 with a0 = up x base, so
+        # R_pitch(R_az a0) R_az = R_az R_pitch(a0): pitch base once per ring (P rotations, not P*S),
+        # then sweep every ring around up.
+        v = _rotate_rows(base[None, :], a0 / np.linalg.norm(a0), cp, sp)
+        r_vec = _sweep_about_up(v, up, cos_t, sin_t).reshape(-1, 3)
+    else:
+        # One azimuth sweep around up, shared by every pitch ring.
+        r_az = _sweep_about_up(base[None, :], up, cos_t, sin_t)[0]
+        if not active.any():
+            r_vec = np.tile(r_az, (len(pitch_angles), 1))
+        else:
+            # base is parallel to up, so up x r_az cannot define the pitch axis; fall back per row.
+            pitch_axes = np.empty_like(r_az)
+            for i in range(r_az.shape[0]):
+                pitch_axes[i] = _as_np(_normalize(_perpendicular_right(world_up, Gf.Vec3d(*r_az[i].tolist()))))
+            r_vec = _rotate_rows(r_az[None, :, :], pitch_axes[None, :, :], cp[:, None], sp[:, None]).reshape(-1, 3)
+
+    eye = _as_np(orbit_origin)[None, :] + r_vec
+    fwd = _normalize_rows(_as_np(center)[None, :] - eye)
+    right_raw = np.cross(fwd, up)
+    degenerate = np.linalg.norm(right_raw, axis=1) < 1.0e-6
+    if degenerate.any():
+        fallback_axis = np.array([1.0, 0.0, 0.0]) if abs(up[0]) < 0.9 else np.array([0.0, 1.0, 0.0])
+        right_raw[degenerate] = np.cross(fwd[degenerate], fallback_axis)
+    right = _normalize_rows(right_raw)
+    cam_up = _normalize_rows(np.cross(right, fwd))
+
+    mats = np.zeros((eye.shape[0], 4, 4), dtype=np.float64)
+    mats[:, 0, :3] = right
+    mats[:, 1, :3] = cam_up
+    mats[:, 2, :3] = -fwd
+    mats[:, 3, :3] = eye
+    mats[:, 3, 3] = 1.0
+    return mats
+
+
+def _quats_from_frame_matrices(mats: np.ndarray) -> np.ndarray:
+    """(w, x, y, z) unit quaternions of the rotation blocks of row-vector matrices, shape (N, 4).
+
+    Shepperd's method on R = M[:3, :3]^T, taking the best-conditioned branch per frame.
+    """
+    np = _np()
+    R = np.transpose(mats[:, :3, :3], (0, 2, 1))
+    r00, r11, r22 = R[:, 0, 0], R[:, 1, 1], R[:, 2, 2]
+    diag = np.stack([r00 + r11 + r22, r00, r11, r22], axis=1)
+    branch = np.argmax(diag, axis=1)
+    q = np.empty((mats.shape[0], 4), dtype=np.float64)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        s0 = np.sqrt(np.maximum(1.0 + r00 + r11 + r22, 0.0)) * 2.0
+        s1 = np.sqrt(np.maximum(1.0 + r00 - r11 - r22, 0.0)) * 2.0
+        s2 = np.sqrt(np.maximum(1.0 - r00 + r11 - r22, 0.0)) * 2.0
+        s3 = np.sqrt(np.maximum(1.0 - r00 - r11 + r22, 0.0)) * 2.0
+        candidates = np.stack(
+            [
+                np.stack([0.25 * s0, (R[:, 2, 1] - R[:, 1, 2]) / s0, (R[:, 0, 2] - R[:, 2, 0]) / s0, (R[:, 1, 0] - R[:, 0, 1]) / s0], axis=1),
+                np.stack([(R[:, 2, 1] - R[:, 1, 2]) / s1, 0.25 * s1, (R[:, 0, 1] + R[:, 1, 0]) / s1, (R[:, 0, 2] + R[:, 2, 0]) / s1], axis=1),
+                np.stack([(R[:, 0, 2] - R[:, 2, 0]) / s2, (R[:, 0, 1] + R[:, 1, 0]) / s2, 0.25 * s2, (R[:, 1, 2] + R[:, 2, 1]) / s2], axis=1),
+                np.stack([(R[:, 1, 0] - R[:, 0, 1]) / s3, (R[:, 0, 2] + R[:, 2, 0]) / s3, (R[:, 1, 2] + R[:, 2, 1]) / s3, 0.25 * s3], axis=1),
+            ],
+            axis=1,
+        )
+    q[:] = candidates[np.arange(mats.shape[0]), branch]
+    return q / np.linalg.norm(q, axis=1, keepdims=True)
 
 
 def _perpendicular_right(world_up: Gf.Vec3d, hint: Optional[Gf.Vec3d] = None) -> Gf.Vec3d:
-    candidates = []
-    if hint is not None and hint.GetLength() > 1e-9:
-        candidates.append(hint)
-    candidates.extend([Gf.Vec3d(1, 0, 0), Gf.Vec3d(0, 1, 0), Gf.Vec3d(0, 0, 1)])
-    for cand in candidates:
-        if abs(Gf.Dot(world_up, cand)) > 0.95:
-            continue
-        try:
-            v = _normalize(Gf.Cross(world_up, cand))
-        except Exception:
-            v = Gf.Vec3d(0, 0, 0)
+    from pxr import Gf  # type: ignore
+
+    if hint is not None and hint.GetLength() > 1e-9 and abs(Gf.Dot(world_up, hint)) <= 0.95:
+        v = _normalized_cross(world_up, hint)
         if v.GetLength() > 1e-6:
             return v
-    # Last resort: pick an arbitrary orthogonal axis
-    alt = Gf.Vec3d(1, 0, 0) if abs(world_up[0]) < abs(world_up[1]) else Gf.Vec3d(0, 1, 0)
-    try:
-        v = _normalize(Gf.Cross(world_up, alt))
-    except Exception:
-        v = Gf.Vec3d(1, 0, 0)
+    # The world axis least aligned with up (smallest |component|) is never near-parallel to it.
+    idx = min(range(3), key=lambda i: abs(world_up[i]))
+    axis = Gf.Vec3d(0, 0, 0)
+    axis[idx] = 1.0
+    v = _normalized_cross(world_up, axis)
     return v if v.GetLength() > 1e-6 else Gf.Vec3d(1, 0, 0)
 
 
-def create_orbit_camera_animation_and_export(src_usd_path: str, out_usd_path: str, params: OrbitParams) -> str:
+def create_orbit_camera_animation_and_export(
+    src_usd_path: str,
+    out_usd_path: str,
+    params: OrbitParams,
+    *,
+    bbox_cache: Optional[UsdGeom.BBoxCache] = None,
+    stage: Optional[Usd.Stage] = None,
+) -> str:
     """Create/overwrite an Orbit camera, author per-frame xform samples for an orbit, and export stage.
 
+    ``bbox_cache`` (see ``make_bbox_cache``) may be shared across calls on the same stage.
+    Pass an already-open ``stage`` to skip re-opening ``src_usd_path``; the camera and the
+    stage frame range are then authored into that stage.
     Returns the created camera prim path.
     """
-    stage = Usd.Stage.Open(src_usd_path)
+    from pxr import Gf, Sdf, Usd, UsdGeom, Vt  # type: ignore
+
+    from ._source_camera import find_first_camera, remember_authored_camera
+
+    if params.xform_op_mode not in ("translate_orient", "transform"):
+        raise ValueError(f"Unsupported xform_op_mode: {params.xform_op_mode}")
+    # Unpack params once; everything below works on locals.
+    num_shots = int(params.num_shots)
+    radius_scale = float(params.radius_scale)
+    fallback_fov_h = math.radians(max(1e-3, float(params.fallback_fov_deg)))
+    fallback_aspect = max(1e-6, float(params.fallback_aspect))
+    fallback_near = float(params.fallback_near_clip)
+    fallback_far = float(params.fallback_far_clip)
+    if stage is None:
+        stage = Usd.Stage.Open(src_usd_path)
     if stage is None:
         raise RuntimeError(f"Failed to open stage: {src_usd_path}")
 
-    center, size = _bbox_center_and_size(stage, params.target_prim_path)
+    center, size = _bbox_center_and_size(stage, params.target_prim_path, bbox_cache)
     world_up = _normalize(_world_up(stage))
 
+    # Fallback source camera is looked up (memoized per open stage) before our own Define
+    first_cam = None
+    if not params.source_camera_path:
+        first_cam = find_first_camera(
+            stage, params.camera_basename, lambda prim: not _is_viewer_observer_camera(prim, params.camera_basename)
+        )
+
     # Prepare camera prim
-    cam_path = params.camera_basename
-    if stage.GetPrimAtPath(cam_path):
-        i = 1
-        while stage.GetPrimAtPath(f"{params.camera_basename}_{i}"):
-            i += 1
-        cam_path = f"{params.camera_basename}_{i}"
-    cam = UsdGeom.Camera.Define(stage, Sdf.Path(cam_path))
+    cam_path = unique_camera_path(stage, params.camera_basename)
+    cam = UsdGeom.Camera.Define(stage, sdf_path(cam_path))
 
     # Copy intrinsics from a source camera if any, keep reference transform for orbit radius
     r0: Optional[Gf.Vec3d] = None
@@ -258,17 +445,12 @@ def create_orbit_camera_animation_and_export(src_usd_path: str, out_usd_path: st
     # Copy intrinsics from a source camera if any
     src_cam_prim = None
     if params.source_camera_path:
-        p = Sdf.Path(params.source_camera_path)
+        p = sdf_path(params.source_camera_path)
         prim = stage.GetPrimAtPath(p)
         if prim and prim.IsValid() and prim.GetTypeName() == "Camera":
             src_cam_prim = prim
     else:
-        for prim in stage.Traverse():
-            if prim.GetTypeName() == "Camera":
-                if _is_viewer_observer_camera(prim, params.camera_basename):
-                    continue
-                src_cam_prim = prim
-                break
+        src_cam_prim = first_cam
     if src_cam_prim is not None:
         s = UsdGeom.Camera(src_cam_prim)
         for getter, setter_name in [
@@ -306,80 +488,62 @@ def create_orbit_camera_animation_and_export(src_usd_path: str, out_usd_path: st
                 height_offset = float(Gf.Dot(candidate, world_up))
                 half_height = max(float(abs(size[2])) * 0.5, 0.0)
                 height_offset = max(-half_height, min(half_height, height_offset))
-                try:
-                    right_hint = _normalize(Gf.Cross(world_up, _normalize(r0)))
-                except Exception:
-                    right_hint = None
+                right_hint = _normalized_cross(world_up, r0)
 
     # Compute radius and start eye from any camera or from bbox
     # Prefer radius derived from source camera location so we match the author's interior viewpoint
     if r0 is not None:
-        base_vec = r0 * float(params.radius_scale)
+        base_vec = r0 * radius_scale
     else:
         fallback_used = True
         right0 = _perpendicular_right(world_up, right_hint)
-        hx = float(size[0]) * 0.5
-        hy = float(size[1]) * 0.5
-        hz = float(size[2]) * 0.5
-        corners = [
-            Gf.Vec3d(sx * hx, sy * hy, sz * hz)
-            for sx in (-1.0, 1.0)
-            for sy in (-1.0, 1.0)
-            for sz in (-1.0, 1.0)
-        ]
-        w_half = max(abs(Gf.Dot(corner, right0)) for corner in corners)
-        h_half = max(abs(Gf.Dot(corner, world_up)) for corner in corners)
-        fov_h = math.radians(max(1e-3, float(params.fallback_fov_deg)))
-        aspect = max(1e-6, float(params.fallback_aspect))
+        np = _np()
+        half = np.array([size[0], size[1], size[2]], dtype=np.float64) * 0.5
+        corners = _corner_signs() * half
+        w_half = float(np.abs(corners @ _as_np(right0)).max())
+        h_half = float(np.abs(corners @ _as_np(world_up)).max())
         # Avoid div-zero by clamping denominator
-        tan_h = max(1e-6, math.tan(fov_h * 0.5))
-        fov_v = 2.0 * math.atan(math.tan(fov_h * 0.5) / aspect)
+        tan_h = max(1e-6, math.tan(fallback_fov_h * 0.5))
+        fov_v = 2.0 * math.atan(math.tan(fallback_fov_h * 0.5) / fallback_aspect)
         tan_v = max(1e-6, math.tan(fov_v * 0.5))
         dist_h = w_half / tan_h
         dist_v = h_half / tan_v
         distance = max(dist_h, dist_v) * float(params.fallback_padding)
-        base_radius = distance * float(params.radius_scale)
+        base_radius = distance * radius_scale
         base_vec = right0 * base_radius
 
     # Assign default intrinsics when falling back to synthetic camera settings
     if fallback_used:
         try:
             focal_mm = float(params.fallback_focal_mm)
-            fov_h = math.radians(max(1e-3, float(params.fallback_fov_deg)))
-            horiz_aperture = 2.0 * focal_mm * math.tan(fov_h * 0.5)
-            aspect = max(1e-6, float(params.fallback_aspect))
+            horiz_aperture = 2.0 * focal_mm * math.tan(fallback_fov_h * 0.5)
             cam.GetFocalLengthAttr().Set(focal_mm)
             cam.GetHorizontalApertureAttr().Set(horiz_aperture)
-            cam.GetVerticalApertureAttr().Set(horiz_aperture / aspect)
-            cam.GetClippingRangeAttr().Set(
-                Gf.Vec2f(float(params.fallback_near_clip), float(params.fallback_far_clip))
-            )
+            cam.GetVerticalApertureAttr().Set(horiz_aperture / fallback_aspect)
+            cam.GetClippingRangeAttr().Set(Gf.Vec2f(fallback_near, fallback_far))
         except Exception:
             pass
 
     # Ensure the camera's clipping range encloses the target so renders do not black out.
-    try:
-        radius = float(base_vec.GetLength())
-    except Exception:
-        radius = 0.0
-    diag = float(size.GetLength()) if hasattr(size, "GetLength") else math.sqrt(size[0] ** 2 + size[1] ** 2 + size[2] ** 2)
+    radius = base_vec.GetLength()
+    diag = size.GetLength()
     half_diag = max(0.5 * diag, 1.0)
-    far_needed = max(radius + half_diag * 1.5, half_diag * 2.0, float(params.fallback_far_clip))
+    far_needed = max(radius + half_diag * 1.5, half_diag * 2.0, fallback_far)
     clip_attr = cam.GetClippingRangeAttr()
     clip_val = clip_attr.Get()
     if clip_val is None or not all(math.isfinite(x) for x in clip_val):
-        near = float(params.fallback_near_clip)
-        far = float(params.fallback_far_clip)
+        near = fallback_near
+        far = fallback_far
     else:
         near, far = float(clip_val[0]), float(clip_val[1])
-    near = max(float(params.fallback_near_clip), near)
+    near = max(fallback_near, near)
     far = max(far, far_needed)
     if far <= near:
         # Keep a reasonable separation between near/far planes if the prior values collapse.
         far = max(far_needed, near * 10.0, near + 10.0)
     clip_attr.Set(Gf.Vec2f(float(near), float(far)))
 
-    step = (2.0 * math.pi) / max(1, int(params.num_shots))
+    step = (2.0 * math.pi) / max(1, num_shots)
     sign = -1.0 if bool(params.cw_rotate) else 1.0
     start = math.radians(float(params.start_deg))
     vertical_count = max(1, int(params.vertical_steps))
@@ -394,35 +558,45 @@ def create_orbit_camera_animation_and_export(src_usd_path: str, out_usd_path: st
     orbit_origin = center + world_up * height_offset
     frame_index = 0
 
-    # Ensure we have a transform op and author time-sampled matrices
+    thetas = start + sign * step * _np().arange(num_shots, dtype="float64")
+    mats = _orbit_frame_matrices(base_vec, world_up, orbit_origin, center, thetas, pitch_angles)
+
+    # Samples go straight into the edit-target layer (no UsdAttribute resolution per sample).
+    # Bulk timeSamples via SetInfo is not exposed to Python, so it is one SetTimeSample per value.
+    edit_target = stage.GetEditTarget()
+    layer = edit_target.GetLayer()
     xf = UsdGeom.Xformable(cam)
-    ops = xf.GetOrderedXformOps()
-    xop = ops[0] if (ops and ops[0].GetOpType() == UsdGeom.XformOp.TypeTransform) else xf.AddTransformOp()
-
-    for pitch in pitch_angles:
-        for i in range(int(params.num_shots)):
-            theta = start + sign * step * i
-            r_vec = _rotate_vec(base_vec, world_up, theta)
-            if abs(pitch) > 1.0e-6:
-                axis = _normalize(Gf.Cross(world_up, r_vec))
-                if axis.GetLength() < 1.0e-6:
-                    axis = _normalize(_perpendicular_right(world_up, r_vec))
-                r_vec = _rotate_vec(r_vec, axis, pitch)
-            eye = orbit_origin + r_vec
-            fwd = _normalize(center - eye)
-            right = _normalize(Gf.Cross(fwd, world_up))
-            if right.GetLength() < 1e-6:
-                tmp2 = Gf.Vec3d(1, 0, 0) if abs(world_up[0]) < 0.9 else Gf.Vec3d(0, 1, 0)
-                right = _normalize(Gf.Cross(fwd, tmp2))
-            up = _normalize(Gf.Cross(right, fwd))
-            M = _build_world_matrix_rows(right, up, fwd, eye)
-            xop.Set(M, time=Usd.TimeCode(frame_index))
-            frame_index += 1
+    if params.xform_op_mode == "transform":
+        ops = xf.GetOrderedXformOps()
+        xop = ops[0] if (ops and ops[0].GetOpType() == UsdGeom.XformOp.TypeTransform) else xf.AddTransformOp()
+        xop_path = edit_target.MapToSpecPath(xop.GetAttr().GetPath())
+        # One buffer copy into Gf.Matrix4d values instead of a Python constructor call per frame.
+        frames = Vt.Matrix4dArray.FromNumpy(_np().ascontiguousarray(mats, dtype="float64"))
+        with Sdf.ChangeBlock():
+            for m in frames:
+                layer.SetTimeSample(xop_path, float(frame_index), m)
+                frame_index += 1
+    else:
+        translate_path = edit_target.MapToSpecPath(xf.AddTranslateOp().GetAttr().GetPath())
+        orient_path = edit_target.MapToSpecPath(
+            xf.AddOrientOp(UsdGeom.XformOp.PrecisionFloat).GetAttr().GetPath()
+        )
+        eyes = mats[:, 3, :3].tolist()
+        quats = _quats_from_frame_matrices(mats).tolist()
+        with Sdf.ChangeBlock():
+            for eye, (w, x, y, z) in zip(eyes, quats):
+                layer.SetTimeSample(translate_path, float(frame_index), Gf.Vec3d(*eye))
+                layer.SetTimeSample(orient_path, float(frame_index), Gf.Quatf(w, x, y, z))
+                frame_index += 1
 
     # Set stage frame range for convenience
     stage.SetStartTimeCode(0)
     stage.SetEndTimeCode(max(0, frame_index - 1))
     stage.SetTimeCodesPerSecond(24)
 
+    if not params.source_camera_path:
+        # Orbit cameras never qualify as a source; restore the memo our own Define cleared
+        remember_authored_camera(stage, params.camera_basename, first_cam, cam_path, False)
+
     stage.Export(out_usd_path)
     return cam_path
@@ -3,24 +3,84 @@
 import os
 import sys
 import argparse
-import math
 
 
 def _to_posix(p: str) -> str:
     return p.replace("\\", "/") if isinstance(p, str) else p
 
 
-def main(argv: list[str] | None = None) -> int:
-    parser = argparse.ArgumentParser(
-        prog="convert-asset",
-        description="USD conversion utilities (no-MDL copy generator)"
-    )
-    sub = parser.add_subparsers(dest="cmd", required=False)
+def _all_triangle_counts(counts) -> bool:
+    """True if every faceVertexCounts entry is 3, as one numpy reduction instead of an int() per face.
+
+    A non-3 first face rejects (quad/ngon meshes) without converting the whole array.
+    """
+    if len(counts) and counts[0] != 3:
+        return False
+    import numpy as np
+
+    return bool((np.asarray(counts) == 3).all())
+
+
+def _render_mesh_prims(stage) -> list:
+    """Active, non-instance-proxy Mesh prims whose purpose is not proxy/guide, in traversal order.
+
+    Non-mesh prims cost one type-name call; purpose is computed only for meshes.
+    """
+    from pxr import Usd, UsdGeom  # type: ignore
 
-    p_nomdl = sub.add_parser("no-mdl", help="Generate *_noMDL.usd siblings recursively")
-    p_nomdl.add_argument("src", help="Path to top or single USD file")
-    p_nomdl.add_argument("--only-new-usd", action="store_true", help="Only write the new *_noMDL.usd; do not emit sidecar summary/audit files")
-    p_nomdl.add_argument(
+    hidden = (UsdGeom.Tokens.proxy, UsdGeom.Tokens.guide)
+    prims = []
+    # The default predicate prunes inactive subtrees in C++ and never descends into instances,
+    # so no per-prim IsActive()/IsInstanceProxy() calls are needed.
+    for prim in Usd.PrimRange.Stage(stage, Usd.PrimDefaultPredicate):
+        if prim.GetTypeName() != "Mesh":
+            continue
+        if UsdGeom.Imageable(prim).ComputePurpose() in hidden:
+            continue
+        prims.append(prim)
+    return prims
+
+
+def _print_simplify_summary(
+    apply: bool,
+    meshes_total: int,
+    meshes_tri: int,
+    skipped_non_tri: int,
+    faces_before: int,
+    faces_after: int,
+    verts_before: int,
+    verts_after: int,
+    out_path: str | None,
+) -> None:
+    """mesh-simplify tail report shared by every backend; ``out_path`` is None unless exported."""
+    mode = "APPLY" if apply else "DRY-RUN"
+    print(f"[{mode}] meshes total={meshes_total} tri={meshes_tri} skipped_non_tri={skipped_non_tri}")
+    print(f"faces: {faces_before} -> {faces_after}")
+    print(f"verts: {verts_before} -> {verts_after}")
+    if out_path:
+        print("Exported:", out_path)
+
+
+# One-line help per subcommand, in --help order; the fast top-level --help path reads only this.
+_SUBCOMMAND_HELP = {
+    "no-mdl": "Generate *_noMDL.usd siblings recursively",
+    "mesh-faces": "Count total render mesh faces in a USD stage",
+    "mesh-simplify": "Simplify render meshes using QEM (triangles only)",
+    "inspect": "Inspect a Material's MDL or UsdPreviewSurface network",
+    "export-mdl-materials": "Export MDL materials in this file into standalone material USDs",
+    "thumbnails": "Render multi-view thumbnails of scene instances with background (Isaac Sim)",
+    "render-single": "Render one USD asset from orbit views with local Isaac Sim",
+    "export-glb": "Export USD to GLB (Pure Python, Lightweight)",
+    "usd-to-glb": "One-step pipeline: no-mdl -> glb -> cleanup intermediate files",
+    "normalize-asset": "AAN MVP: write a dry-run asset package evidence manifest",
+}
+
+
+def _build_no_mdl(sub) -> None:
+    p = sub.add_parser("no-mdl", help=_SUBCOMMAND_HELP["no-mdl"])
+    p.add_argument("src", help="Path to top or single USD file")
+    p.add_argument("--only-new-usd", action="store_true", help="Only write the new *_noMDL.usd; do not emit sidecar summary/audit files")
+    p.add_argument(
         "--resolve-textures-to-absolute",
         action="store_true",
         default=False,
@@ -30,73 +90,86 @@ def main(argv: list[str] | None = None) -> int:
         ),
     )
 
-    p_faces = sub.add_parser("mesh-faces", help="Count total render mesh faces in a USD stage")
-    p_faces.add_argument("src", help="Path to USD file")
-
-    p_simpl = sub.add_parser("mesh-simplify", help="Simplify render meshes using QEM (triangles only)")
-    p_simpl.add_argument("src", help="Path to USD file (input)")
-    p_simpl.add_argument("--ratio", type=float, default=0.5, help="Target face ratio (0..1], default 0.5")
-    p_simpl.add_argument("--max-collapses", type=int, default=None, help="Max face collapses (safety cap)")
-    p_simpl.add_argument("--apply", action="store_true", help="Apply changes and export to --out")
-    p_simpl.add_argument("--out", default=None, help="Output USD path (required when --apply)")
-    p_simpl.add_argument("--target-faces", type=int, default=None, help="Plan ratio to reach total faces <= this value (overrides --ratio)")
-    p_simpl.add_argument("--progress", action="store_true", help="Show periodic progress (no console flood)")
-    p_simpl.add_argument("--progress-interval-collapses", type=int, default=10000, help="Emit progress every N collapses (default 10000)")
-    p_simpl.add_argument("--time-limit", type=float, default=None, help="Per-mesh time limit in seconds (abort mesh when exceeded)")
-    p_simpl.add_argument("--backend", choices=["py","cpp","cpp-uv"], default="py", help="Simplifier backend: pure Python ('py'), native C++ executable ('cpp'), or C+++UV pybind ('cpp-uv')")
-    p_simpl.add_argument("--cpp-exe", default="native/meshqem/build/meshqem", help="Path to C++ meshqem executable when --backend=cpp")
-
-    p_inspect = sub.add_parser("inspect", help="Inspect a Material's MDL or UsdPreviewSurface network")
-    p_inspect.add_argument("src", help="Path to USD file")
-    p_inspect.add_argument("mode", choices=["mdl", "usdpreview"], help="Inspection mode: mdl or usdpreview")
-    p_inspect.add_argument("prim", help="Material prim path (e.g. /Root/Looks/Mat001)")
-    p_inspect.add_argument("--json", action="store_true", help="Output JSON (future placeholder)")
-
-    p_export = sub.add_parser("export-mdl-materials", help="Export MDL materials in this file into standalone material USDs")
-    p_export.add_argument("src", help="Path to USD file")
-    p_export.add_argument("--out-dir-name", default="mdl_materials", help="Folder name under the file's directory to place exported materials")
-    p_export.add_argument("--binary", action="store_true", help="Write .usd binary instead of .usda ascii")
-    p_export.add_argument("--placement", choices=["authoring", "root"], default="authoring", help="Where to place exports: alongside the authoring (weakest) layer of each material, or under root file directory")
-    p_export.add_argument("--no-external", action="store_true", help="Only export materials authored in root layer (skip externally referenced ones)")
-    p_export.add_argument("--mode", choices=["mdl", "preview"], default="mdl", help="Export mode: 'mdl' preserves MDL shader and outputs, 'preview' builds UsdPreviewSurface network")
-    p_export.add_argument("--emit-ball", action="store_true", help="Also write a small preview scene with a bound sphere next to each exported material")
-    p_export.add_argument("--assets-path-mode", choices=["relative", "absolute"], default="relative", help="Rewrite asset paths as relative (default) or absolute in exported materials")
-
-    # thumbnails generation subcommand (requires Isaac Sim runtime)
-    p_thumb = sub.add_parser("thumbnails", help="Render multi-view thumbnails of scene instances with background (Isaac Sim)")
-    p_thumb.add_argument("src", help="Path to USD file (scene)")
-    p_thumb.add_argument("--out", dest="out", default=None, help="Output directory (defaults to <srcdir>/thumbnails/multi_views_with_bg)")
-    p_thumb.add_argument("--instance-scope", dest="instance_scope", default="scene/Instances", help="Scope under /World containing instances")
-    p_thumb.add_argument("--width", dest="width", type=int, default=600, help="Image width (default 600)")
-    p_thumb.add_argument("--height", dest="height", type=int, default=450, help="Image height (default 450)")
-    p_thumb.add_argument("--views", dest="views", type=int, default=6, help="Number of views (even number, split top/bottom; default 6)")
-    p_thumb.add_argument("--warmup-steps", dest="warmup_steps", type=int, default=1000, help="Simulation warmup steps before rendering (default 1000)")
-    p_thumb.add_argument("--render-steps", dest="render_steps", type=int, default=8, help="Render steps per view (default 8)")
-    p_thumb.add_argument("--focal-mm", dest="focal_mm", type=float, default=9.0, help="Camera focal length in mm (default 9.0)")
-    p_thumb.add_argument("--bbox-threshold", dest="bbox_threshold", type=float, default=0.8, help="Tight/loose 2D bbox area ratio threshold to accept a view (default 0.8)")
-    p_thumb.add_argument("--no-bbox-draw", dest="no_bbox_draw", action="store_true", help="Do not draw bbox on saved images")
-    p_thumb.add_argument("--skip-model-filter", dest="skip_model_filter", action="store_true", help="Skip filtering using models dir names")
-
-    # local Isaac Sim single-asset render (no render-usd conda/runtime dependency)
-    p_render = sub.add_parser("render-single", help="Render one USD asset from orbit views with local Isaac Sim")
-    p_render.add_argument("src", help="Path to USD file")
-    p_render.add_argument("--out", required=True, help="Output root directory")
-    p_render.add_argument("--width", type=int, default=512, help="Image width (default 512)")
-    p_render.add_argument("--height", type=int, default=512, help="Image height (default 512)")
-    p_render.add_argument("--views", type=int, default=4, help="Number of orbit views (default 4)")
-    p_render.add_argument("--naming-style", choices=["index", "view"], default="index", help="Output naming style")
-    p_render.add_argument("--overwrite", action="store_true", help="Overwrite existing PNG files")
-    p_render.add_argument("--warmup-steps", type=int, default=100, help="Simulation warmup steps before capture (default 100)")
-    p_render.add_argument("--render-steps", type=int, default=8, help="Rendered steps before capture (default 8)")
-    p_render.add_argument("--focal-mm", type=float, default=18.0, help="Camera focal length in mm (default 18)")
-    p_render.add_argument("--elevation", type=float, default=35.0, help="Camera elevation in degrees (default 35)")
-    p_render.add_argument("--azimuth-offset", type=float, default=0.0, help="Initial azimuth in degrees (default 0)")
-    p_render.add_argument("--min-distance", type=float, default=0.1, help="Minimum camera distance (default 0.1)")
-    p_render.add_argument("--background-color", default="40,40,40", help="RGB background used for alpha composite, e.g. 40,40,40")
-    p_render.add_argument("--extent-fallback-ratio", type=float, default=5.0, help="Use mesh bbox when authored bbox diagonal is this many times larger (default 5)")
-    p_render.add_argument("--center-offset-threshold", type=float, default=1.0, help="Use mesh bbox when authored bbox center offset exceeds this mesh-diagonal ratio (default 1)")
-    p_render.add_argument("--renderer", default="PathTracing", help="Isaac renderer name (default PathTracing)")
-    p_render.add_argument(
+
+def _build_mesh_faces(sub) -> None:
+    p = sub.add_parser("mesh-faces", help=_SUBCOMMAND_HELP["mesh-faces"])
+    p.add_argument("src", help="Path to USD file")
+
+
+def _build_mesh_simplify(sub) -> None:
+    p = sub.add_parser("mesh-simplify", help=_SUBCOMMAND_HELP["mesh-simplify"])
+    p.add_argument("src", help="Path to USD file (input)")
+    p.add_argument("--ratio", type=float, default=0.5, help="Target face ratio (0..1], default 0.5")
+    p.add_argument("--max-collapses", type=int, default=None, help="Max face collapses (safety cap)")
+    p.add_argument("--apply", action="store_true", help="Apply changes and export to --out")
+    p.add_argument("--out", default=None, help="Output USD path (required when --apply)")
+    p.add_argument("--target-faces", type=int, default=None, help="Plan ratio to reach total faces <= this value (overrides --ratio)")
+    p.add_argument("--progress", action="store_true", help="Show periodic progress (no console flood)")
+    p.add_argument("--progress-interval-collapses", type=int, default=10000, help="Emit progress every N collapses (default 10000)")
+    p.add_argument("--time-limit", type=float, default=None, help="Per-mesh time limit in seconds (abort mesh when exceeded)")
+    p.add_argument("--backend", choices=["py","cpp","cpp-uv"], default="py", help="Simplifier backend: pure Python ('py'), native C++ executable ('cpp'), or C+++UV pybind ('cpp-uv')")
+    p.add_argument("--cpp-exe", default="native/meshqem/build/meshqem", help="Path to C++ meshqem executable when --backend=cpp")
+
+
+def _build_inspect(sub) -> None:
+    p = sub.add_parser("inspect", help=_SUBCOMMAND_HELP["inspect"])
+    p.add_argument("src", help="Path to USD file")
+    p.add_argument("mode", choices=["mdl", "usdpreview"], help="Inspection mode: mdl or usdpreview")
+    p.add_argument("prim", help="Material prim path (e.g. /Root/Looks/Mat001)")
+    p.add_argument("--json", action="store_true", help="Output JSON (future placeholder)")
+
+
+def _build_export_mdl_materials(sub) -> None:
+    p = sub.add_parser("export-mdl-materials", help=_SUBCOMMAND_HELP["export-mdl-materials"])
+    p.add_argument("src", help="Path to USD file")
+    p.add_argument("--out-dir-name", default="mdl_materials", help="Folder name under the file's directory to place exported materials")
+    p.add_argument("--binary", action="store_true", help="Write .usd binary instead of .usda ascii")
+    p.add_argument("--placement", choices=["authoring", "root"], default="authoring", help="Where to place exports: alongside the authoring (weakest) layer of each material, or under root file directory")
+    p.add_argument("--no-external", action="store_true", help="Only export materials authored in root layer (skip externally referenced ones)")
+    p.add_argument("--mode", choices=["mdl", "preview"], default="mdl", help="Export mode: 'mdl' preserves MDL shader and outputs, 'preview' builds UsdPreviewSurface network")
+    p.add_argument("--emit-ball", action="store_true", help="Also write a small preview scene with a bound sphere next to each exported material")
+    p.add_argument("--assets-path-mode", choices=["relative", "absolute"], default="relative", help="Rewrite asset paths as relative (default) or absolute in exported materials")
+    p.add_argument("--material-root", dest="material_roots", action="append", default=None, help="Only search this prim subtree for materials (repeatable, e.g. /Root/Looks); default: whole stage")
+
+
+# thumbnails generation subcommand (requires Isaac Sim runtime)
+def _build_thumbnails(sub) -> None:
+    p = sub.add_parser("thumbnails", help=_SUBCOMMAND_HELP["thumbnails"])
+    p.add_argument("src", help="Path to USD file (scene)")
+    p.add_argument("--out", dest="out", default=None, help="Output directory (defaults to <srcdir>/thumbnails/multi_views_with_bg)")
+    p.add_argument("--instance-scope", dest="instance_scope", default="scene/Instances", help="Scope under /World containing instances")
+    p.add_argument("--width", dest="width", type=int, default=600, help="Image width (default 600)")
+    p.add_argument("--height", dest="height", type=int, default=450, help="Image height (default 450)")
+    p.add_argument("--views", dest="views", type=int, default=6, help="Number of views (even number, split top/bottom; default 6)")
+    p.add_argument("--warmup-steps", dest="warmup_steps", type=int, default=1000, help="Simulation warmup steps before rendering (default 1000)")
+    p.add_argument("--render-steps", dest="render_steps", type=int, default=8, help="Render steps per view (default 8)")
+    p.add_argument("--focal-mm", dest="focal_mm", type=float, default=9.0, help="Camera focal length in mm (default 9.0)")
+    p.add_argument("--bbox-threshold", dest="bbox_threshold", type=float, default=0.8, help="Tight/loose 2D bbox area ratio threshold to accept a view (default 0.8)")
+    p.add_argument("--no-bbox-draw", dest="no_bbox_draw", action="store_true", help="Do not draw bbox on saved images")
+    p.add_argument("--skip-model-filter", dest="skip_model_filter", action="store_true", help="Skip filtering using models dir names")
+
+
+# local Isaac Sim single-asset render (no render-usd conda/runtime dependency)
+def _build_render_single(sub) -> None:
+    p = sub.add_parser("render-single", help=_SUBCOMMAND_HELP["render-single"])
+    p.add_argument("src", help="Path to USD file")
+    p.add_argument("--out", required=True, help="Output root directory")
+    p.add_argument("--width", type=int, default=512, help="Image width (default 512)")
+    p.add_argument("--height", type=int, default=512, help="Image height (default 512)")
+    p.add_argument("--views", type=int, default=4, help="Number of orbit views (default 4)")
+    p.add_argument("--naming-style", choices=["index", "view"], default="index", help="Output naming style")
+    p.add_argument("--overwrite", action="store_true", help="Overwrite existing PNG files")
+    p.add_argument("--warmup-steps", type=int, default=100, help="Simulation warmup steps before capture (default 100)")
+    p.add_argument("--render-steps", type=int, default=8, help="Rendered steps before capture (default 8)")
+    p.add_argument("--focal-mm", type=float, default=18.0, help="Camera focal length in mm (default 18)")
+    p.add_argument("--elevation", type=float, default=35.0, help="Camera elevation in degrees (default 35)")
+    p.add_argument("--azimuth-offset", type=float, default=0.0, help="Initial azimuth in degrees (default 0)")
+    p.add_argument("--min-distance", type=float, default=0.1, help="Minimum camera distance (default 0.1)")
+    p.add_argument("--background-color", default="40,40,40", help="RGB background used for alpha composite, e.g. 40,40,40")
+    p.add_argument("--extent-fallback-ratio", type=float, default=5.0, help="Use mesh bbox when authored bbox diagonal is this many times larger (default 5)")
+    p.add_argument("--center-offset-threshold", type=float, default=1.0, help="Use mesh bbox when authored bbox center offset exceeds this mesh-diagonal ratio (default 1)")
+    p.add_argument("--renderer", default="PathTracing", help="Isaac renderer name (default PathTracing)")
+    p.add_argument(
         "--mdl-path",
         dest="mdl_paths",
         action="append",
@@ -104,30 +177,108 @@ def main(argv: list[str] | None = None) -> int:
         help="Additional MDL search path; may be repeated",
     )
 
-    # export-glb subcommand (Pure Python)
-    p_glb = sub.add_parser("export-glb", help="Export USD to GLB (Pure Python, Lightweight)")
-    p_glb.add_argument("src", help="Path to input USD file (recommended: *_noMDL.usd)")
-    p_glb.add_argument("--out", required=True, help="Path to output .glb file")
 
-    # Pipeline: usd-to-glb (no-mdl + export-glb + cleanup)
-    p_pipe = sub.add_parser("usd-to-glb", help="One-step pipeline: no-mdl -> glb -> cleanup intermediate files")
-    p_pipe.add_argument("src", help="Path to source USD file")
-    p_pipe.add_argument("--out", required=True, help="Path to output .glb file")
-    p_pipe.add_argument("--keep-intermediate", action="store_true", help="Do not delete the intermediate *_noMDL.usd file")
+# export-glb subcommand (Pure Python)
+def _build_export_glb(sub) -> None:
+    p = sub.add_parser("export-glb", help=_SUBCOMMAND_HELP["export-glb"])
+    p.add_argument("src", help="Path to input USD file (recommended: *_noMDL.usd)")
+    p.add_argument("--out", required=True, help="Path to output .glb file")
+
+
+# Pipeline: usd-to-glb (no-mdl + export-glb + cleanup)
+def _build_usd_to_glb(sub) -> None:
+    p = sub.add_parser("usd-to-glb", help=_SUBCOMMAND_HELP["usd-to-glb"])
+    p.add_argument("src", help="Path to source USD file")
+    p.add_argument("--out", required=True, help="Path to output .glb file")
+    p.add_argument("--keep-intermediate", action="store_true", help="Do not delete the intermediate *_noMDL.usd file")
+
 
+def _build_normalize_asset(sub) -> None:
     from .asset_application_normalizer.cli import add_normalize_asset_parser
     add_normalize_asset_parser(sub)
 
-    # If no subcommand provided, default to no-mdl for convenience
-    args_ns, extras = parser.parse_known_args(argv)
-    if args_ns.cmd is None:
-        # Re-parse as no-mdl
-        args_ns = parser.parse_args(["no-mdl"] + (argv or []))
+
+# Subcommand -> parser builder; main() only builds the one being dispatched.
+_SUBCOMMAND_BUILDERS = {
+    "no-mdl": _build_no_mdl,
+    "mesh-faces": _build_mesh_faces,
+    "mesh-simplify": _build_mesh_simplify,
+    "inspect": _build_inspect,
+    "export-mdl-materials": _build_export_mdl_materials,
+    "thumbnails": _build_thumbnails,
+    "render-single": _build_render_single,
+    "export-glb": _build_export_glb,
+    "usd-to-glb": _build_usd_to_glb,
+    "normalize-asset": _build_normalize_asset,
+}
+
+
+def _sniff_subcommand(argv: list[str]) -> str | None:
+    """First positional token if it names a known subcommand (the root parser has no value options)."""
+    for tok in argv:
+        if tok.startswith("-"):
+            continue
+        return tok if tok in _SUBCOMMAND_BUILDERS else None
+    return None
+
+
+def _root_parser() -> tuple[argparse.ArgumentParser, argparse._SubParsersAction]:
+    parser = argparse.ArgumentParser(
+        prog="convert-asset",
+        description="USD conversion utilities (no-MDL copy generator)"
+    )
+    return parser, parser.add_subparsers(dest="cmd", required=False)
+
+
+def _print_top_level_help() -> None:
+    """Top-level --help from name/help pairs only: no subcommand arguments, no adapter imports."""
+    parser, sub = _root_parser()
+    for name, text in _SUBCOMMAND_HELP.items():
+        sub.add_parser(name, help=text)
+    parser.print_help()
+
+
+def main(argv: list[str] | None = None) -> int:
+    argv_real = list(sys.argv[1:] if argv is None else argv)
+    if argv_real in (["-h"], ["--help"]):
+        _print_top_level_help()
+        return 0
+    cmd = _sniff_subcommand(argv_real)
+    if cmd is not None and {"-h", "--help"} & set(argv_real[:argv_real.index(cmd)]):
+        # argparse handles a help flag ahead of the subcommand token as top-level help
+        _print_top_level_help()
+        return 0
+    parser, sub = _root_parser()
+    defaulted = cmd is None and not {"-h", "--help"} & set(argv_real)
+    if defaulted:
+        # No subcommand: default to no-mdl for convenience, decided before the one and only parse
+        cmd = "no-mdl"
+        argv_real = ["no-mdl"] + argv_real
+    if cmd is not None:
+        _SUBCOMMAND_BUILDERS[cmd](sub)
+    else:
+        # Help requested alongside unknown input: show every subcommand
+        for build in _SUBCOMMAND_BUILDERS.values():
+            build(sub)
+
+    if defaulted:
+        args_ns = parser.parse_args(argv_real)
+    else:
+        args_ns, extras = parser.parse_known_args(argv_real)
 
     if args_ns.cmd == "normalize-asset":
         from .asset_application_normalizer.cli import run_from_args
         return run_from_args(args_ns)
 
+    # Every other subcommand takes a src file; one stat here replaces the per-branch checks
+    # and returns before any branch imports its runtime (pxr, Isaac Sim).
+    src = _to_posix(args_ns.src)
+    try:
+        os.stat(src)
+    except OSError:
+        print("Not found:", src)
+        return 2
+
     if args_ns.cmd == "no-mdl":
         # Lazy import to avoid requiring pxr unless actually running no-mdl conversion
         # Load processor module first to set runtime switches, then import class
@@ -145,10 +296,6 @@ def main(argv: list[str] | None = None) -> int:
             except Exception:
                 pass
         from .no_mdl.processor import Processor  # pylint: disable=import-error
-        src = _to_posix(args_ns.src)
-        if not os.path.exists(src):
-            print("Not found:", src)
-            return 2
         proc = Processor()
         out = proc.process(src)
         print("\n=== SUMMARY ===")
@@ -158,10 +305,6 @@ def main(argv: list[str] | None = None) -> int:
         return 0
 
     if args_ns.cmd == "mesh-faces":
-        src = _to_posix(args_ns.src)
-        if not os.path.exists(src):
-            print("Not found:", src)
-            return 2
         try:
             from .mesh.faces import count_mesh_faces
             total = count_mesh_faces(src)
@@ -172,10 +315,6 @@ def main(argv: list[str] | None = None) -> int:
         return 0
 
     if args_ns.cmd == "mesh-simplify":
-        src = _to_posix(args_ns.src)
-        if not os.path.exists(src):
-            print("Not found:", src)
-            return 2
         ratio = max(0.0, min(1.0, float(args_ns.ratio)))
         max_collapses = args_ns.max_collapses
         apply = bool(args_ns.apply)
@@ -209,67 +348,78 @@ def main(argv: list[str] | None = None) -> int:
                     time_limit_seconds=float(args_ns.time_limit) if args_ns.time_limit is not None else None,
                 )
             elif args_ns.backend == "cpp":
-                # C++ backend path: iterate meshes, call native exe, then export
+                # C++ backend path: extract meshes, run the native exe concurrently, write back, then export
+                from concurrent.futures import ThreadPoolExecutor
                 from pxr import Usd, UsdGeom  # type: ignore
-                from .mesh.backend_cpp import simplify_mesh_with_cpp
+                from .mesh.backend_cpp import run_cpp_on_tri_mesh, write_tri_mesh_to_prim
+                from .mesh.backend_cpp_impl import extract_tri_mesh_from_prim
                 stage = Usd.Stage.Open(src)
                 if stage is None:
                     print("Failed to open stage:", src)
                     return 3
-                meshes_total = 0
+                render_meshes = _render_mesh_prims(stage)
+                meshes_total = len(render_meshes)
                 meshes_tri = 0
                 skipped_non_tri = 0
                 faces_before = 0
                 faces_after = 0
                 verts_before = 0
                 verts_after = 0
-                for prim in stage.Traverse():
-                    if not prim.IsActive() or prim.IsInstanceProxy():
-                        continue
-                    if prim.GetTypeName() != "Mesh":
-                        continue
-                    img = UsdGeom.Imageable(prim)
-                    purpose = img.ComputePurpose()
-                    if purpose in (UsdGeom.Tokens.proxy, UsdGeom.Tokens.guide):
-                        continue
-                    meshes_total += 1
-                    mesh = UsdGeom.Mesh(prim)
-                    counts = mesh.GetFaceVertexCountsAttr().Get()
+                jobs = []
+                for prim in render_meshes:
+                    counts = UsdGeom.Mesh(prim).GetFaceVertexCountsAttr().Get()
                     if not counts:
                         continue
-                    if not all(int(c) == 3 for c in counts):
+                    if not _all_triangle_counts(counts):
                         skipped_non_tri += 1
                         continue
                     meshes_tri += 1
-                    try:
-                        tb, ta, vb, va = simplify_mesh_with_cpp(
-                            prim,
-                            _to_posix(args_ns.cpp_exe),
+                    points, faces = extract_tri_mesh_from_prim(prim)
+                    if points and faces:
+                        jobs.append((prim, points, faces))
+                # Each mesh is an independent meshqem subprocess; USD reads/writes stay on this thread.
+                # Streamed --progress output would interleave, so it keeps the serial order.
+                workers = 1 if args_ns.progress else (os.cpu_count() or 1)
+                cpp_exe = _to_posix(args_ns.cpp_exe)
+                time_limit = float(args_ns.time_limit) if args_ns.time_limit is not None else None
+                progress_interval = int(args_ns.progress_interval_collapses)
+                show_output = bool(args_ns.progress)
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    futures = [
+                        pool.submit(
+                            run_cpp_on_tri_mesh,
+                            points,
+                            faces,
+                            cpp_exe,
                             ratio=ratio,
                             target_faces=None,
                             max_collapses=max_collapses,
-                            time_limit=float(args_ns.time_limit) if args_ns.time_limit is not None else None,
-                            progress_interval=int(args_ns.progress_interval_collapses),
-                            apply=apply,
-                            show_output=bool(args_ns.progress),
+                            time_limit=time_limit,
+                            progress_interval=progress_interval,
+                            show_output=show_output,
                         )
-                    except RuntimeError as e:
-                        # Skip this mesh but continue others
-                        print(f"[SKIP cpp] {prim.GetPath()} -> {e}")
-                        continue
-                    faces_before += tb
-                    faces_after += ta
-                    verts_before += vb
-                    verts_after += va
+                        for _, points, faces in jobs
+                    ]
+                    for (prim, points, faces), fut in zip(jobs, futures):
+                        try:
+                            new_pts, new_faces = fut.result()
+                        except RuntimeError as e:
+                            # Skip this mesh but continue others
+                            print(f"[SKIP cpp] {prim.GetPath()} -> {e}")
+                            continue
+                        if apply:
+                            write_tri_mesh_to_prim(prim, new_pts, new_faces)
+                        faces_before += len(faces)
+                        faces_after += len(new_faces)
+                        verts_before += len(points)
+                        verts_after += len(new_pts)
                 if apply and out:
                     stage.Export(out)
-                # Print summary similar to Python backend
-                mode = "APPLY" if apply else "DRY-RUN"
-                print(f"[{mode}] meshes total={meshes_total} tri={meshes_tri} skipped_non_tri={skipped_non_tri}")
-                print(f"faces: {faces_before} -> {faces_after}")
-                print(f"verts: {verts_before} -> {verts_after}")
-                if apply and out:
-                    print("Exported:", out)
+                _print_simplify_summary(
+                    apply, meshes_total, meshes_tri, skipped_non_tri,
+                    faces_before, faces_after, verts_before, verts_after,
+                    out if apply else None,
+                )
                 return 0
             else:  # cpp-uv backend via pybind11 bindings
                 from pxr import Usd, UsdGeom  # type: ignore
@@ -278,28 +428,19 @@ def main(argv: list[str] | None = None) -> int:
                 if stage is None:
                     print("Failed to open stage:", src)
                     return 3
-                meshes_total = 0
+                render_meshes = _render_mesh_prims(stage)
+                meshes_total = len(render_meshes)
                 meshes_tri = 0
                 skipped_non_tri = 0
                 faces_before = 0
                 faces_after = 0
                 verts_before = 0
                 verts_after = 0
-                for prim in stage.Traverse():
-                    if not prim.IsActive() or prim.IsInstanceProxy():
-                        continue
-                    if prim.GetTypeName() != "Mesh":
-                        continue
-                    img = UsdGeom.Imageable(prim)
-                    purpose = img.ComputePurpose()
-                    if purpose in (UsdGeom.Tokens.proxy, UsdGeom.Tokens.guide):
-                        continue
-                    meshes_total += 1
-                    mesh = UsdGeom.Mesh(prim)
-                    counts = mesh.GetFaceVertexCountsAttr().Get()
+                for prim in render_meshes:
+                    counts = UsdGeom.Mesh(prim).GetFaceVertexCountsAttr().Get()
                     if not counts:
                         continue
-                    if not all(int(c) == 3 for c in counts):
+                    if not _all_triangle_counts(counts):
                         skipped_non_tri += 1
                         continue
                     meshes_tri += 1
@@ -322,29 +463,23 @@ def main(argv: list[str] | None = None) -> int:
                     verts_after += va
                 if apply and out:
                     stage.Export(out)
-                mode = "APPLY" if apply else "DRY-RUN"
-                print(f"[{mode}] meshes total={meshes_total} tri={meshes_tri} skipped_non_tri={skipped_non_tri}")
-                print(f"faces: {faces_before} -> {faces_after}")
-                print(f"verts: {verts_before} -> {verts_after}")
-                if apply and out:
-                    print("Exported:", out)
+                _print_simplify_summary(
+                    apply, meshes_total, meshes_tri, skipped_non_tri,
+                    faces_before, faces_after, verts_before, verts_after,
+                    out if apply else None,
+                )
                 return 0
         except RuntimeError as e:
             print("ERROR:", e)
             return 3
-        mode = "APPLY" if apply else "DRY-RUN"
-        print(f"[{mode}] meshes total={stats.meshes_total} tri={stats.meshes_tri} skipped_non_tri={stats.skipped_non_tri}")
-        print(f"faces: {stats.faces_before} -> {stats.faces_after}")
-        print(f"verts: {stats.verts_before} -> {stats.verts_after}")
-        if apply and out:
-            print("Exported:", out)
+        _print_simplify_summary(
+            apply, stats.meshes_total, stats.meshes_tri, stats.skipped_non_tri,
+            stats.faces_before, stats.faces_after, stats.verts_before, stats.verts_after,
+            out if apply else None,
+        )
         return 0
 
     if args_ns.cmd == "inspect":
-        src = _to_posix(args_ns.src)
-        if not os.path.exists(src):
-            print("Not found:", src)
-            return 2
         try:
             from pxr import Usd  # type: ignore
             from .inspect_material import inspect_material, format_inspect_result
@@ -361,10 +496,6 @@ def main(argv: list[str] | None = None) -> int:
             return 3
 
     if args_ns.cmd == "export-mdl-materials":
-        src = _to_posix(args_ns.src)
-        if not os.path.exists(src):
-            print("Not found:", src)
-            return 2
         try:
             from pxr import Usd  # type: ignore
             from .export_mdl_materials import export_from_stage
@@ -381,6 +512,7 @@ def main(argv: list[str] | None = None) -> int:
                 export_mode=args_ns.mode,
                 emit_ball=args_ns.emit_ball,
                 assets_path_mode=args_ns.assets_path_mode,
+                material_roots=args_ns.material_roots,
             )
             if not results:
                 print("No MDL materials in root layer were found. Nothing exported.")
@@ -394,10 +526,6 @@ def main(argv: list[str] | None = None) -> int:
             return 3
 
     if args_ns.cmd == "render-single":
-        src = _to_posix(args_ns.src)
-        if not os.path.exists(src):
-            print("Not found:", src)
-            return 2
         try:
             from .render.single import run_render_single
             return int(run_render_single(
@@ -425,10 +553,6 @@ def main(argv: list[str] | None = None) -> int:
             return 3
 
     if args_ns.cmd == "thumbnails":
-        src = _to_posix(args_ns.src)
-        if not os.path.exists(src):
-            print("Not found:", src)
-            return 2
         out_dir = _to_posix(args_ns.out) if args_ns.out else None
         try:
             from .thumbnail import run_thumbnail_pipeline
@@ -452,11 +576,7 @@ def main(argv: list[str] | None = None) -> int:
             return 3
 
     if args_ns.cmd == "export-glb":
-        src = _to_posix(args_ns.src)
         out = _to_posix(args_ns.out)
-        if not os.path.exists(src):
-            print("Not found:", src)
-            return 2
         try:
             from .glb.converter import UsdToGlbConverter
             conv = UsdToGlbConverter()
@@ -469,13 +589,8 @@ def main(argv: list[str] | None = None) -> int:
             return 3
 
     if args_ns.cmd == "usd-to-glb":
-        src = _to_posix(args_ns.src)
         out_glb = _to_posix(args_ns.out)
         keep = bool(args_ns.keep_intermediate)
-        
-        if not os.path.exists(src):
-            print("Not found:", src)
-            return 2
 
         print(f"=== Pipeline: USD -> GLB (src: {src}) ===")
         
@@ -8,35 +8,36 @@ Rules:
 Outputs are stand-alone stages that contain a single Material prim at /Looks/<MaterialName> with internal preview network.
 """
 from __future__ import annotations
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pxr import Usd, UsdShade, Sdf, UsdGeom  # type: ignore
 
 from .no_mdl.materials import ensure_preview, find_mdl_shader, copy_textures, connect_preview, _resolve_abs_path, _anchor_dir_for_attr
 
 
-def _is_in_root_layer(stage: Usd.Stage, prim: Usd.Prim) -> bool:
-    root_id = stage.GetRootLayer().identifier
+def _prim_stack(prim: Usd.Prim) -> list:
     try:
-        for spec in prim.GetPrimStack():
-            if spec.layer.identifier == root_id:
-                return True
+        return list(prim.GetPrimStack())
     except Exception:
-        pass
+        return []
+
+
+def _is_in_root_layer(stack: list, root_id: str) -> bool:
+    """True if any PrimSpec in ``stack`` (from ``_prim_stack``) lives in the root layer ``root_id``."""
+    for spec in stack:
+        if spec.layer.identifier == root_id:
+            return True
     return False
 
 
-def _authoring_layer_dir_for_prim(prim: Usd.Prim) -> str | None:
-    """Try to find the weakest non-anonymous layer contributing a PrimSpec for this prim.
+def _authoring_layer_dir_for_prim(stack: list) -> str | None:
+    """Try to find the weakest non-anonymous layer contributing a PrimSpec in the prim's ``stack``.
     This usually corresponds to the place where the prim was originally defined (referenced child file).
     Return the directory path for that layer, or None if unknown.
     """
-    try:
-        stack = prim.GetPrimStack()
-    except Exception:
-        stack = []
     # search from weakest to strongest
-    for spec in reversed(list(stack)):
+    for spec in reversed(stack):
         lid = getattr(spec.layer, "identifier", "")
         if str(lid).startswith("anon:"):
             continue
@@ -46,11 +47,12 @@ def _authoring_layer_dir_for_prim(prim: Usd.Prim) -> str | None:
     return None
 
 
+# Spaces and characters unsafe in file names all map to "_" in one translate pass
+_SANITIZE_TBL = str.maketrans({c: "_" for c in " <>:\\/|?*\"'`"})
+
+
 def _sanitize_name(name: str) -> str:
-    s = name.strip().replace(" ", "_")
-    bad = "<>:\\/|?*\"'`"
-    for ch in bad:
-        s = s.replace(ch, "_")
+    s = (name or "").strip().translate(_SANITIZE_TBL)
     return s or "Material"
 
 
@@ -58,6 +60,60 @@ def _ensure_dir(path: str):
     os.makedirs(path, exist_ok=True)
 
 
+def _export_one(
+    mdl: UsdShade.Shader,
+    mat_name: str,
+    out_dir: str,
+    export_path: str,
+    *,
+    ascii_usd: bool,
+    export_mode: str,
+    emit_ball: bool,
+    assets_path_mode: str,
+) -> None:
+    """Write one material file (and optional ball scene) from the source MDL shader."""
+    looks_path = "/Looks"
+    # Author in memory and write the file once at the end
+    new_stage = Usd.Stage.CreateInMemory()
+    new_stage.SetDefaultPrim(new_stage.DefinePrim("/Root", "Scope"))
+    new_stage.DefinePrim(looks_path, "Scope")
+    new_mat = UsdShade.Material.Define(new_stage, f"{looks_path}/{mat_name}")
+
+    if export_mode == "preview":
+        # Build preview network and wire textures using original MDL shader as source of truth
+        ensure_preview(new_stage, new_mat)
+        filled, has_c, c_rgb, bc_tex = copy_textures(new_stage, mdl, new_mat)
+        connect_preview(new_stage, new_mat, filled, has_c, c_rgb, bc_tex)
+    else:
+        # MDL-preserving export: duplicate minimal MDL shader metadata and inputs
+        _export_mdl_material(new_stage, new_mat, mdl, assets_path_mode=assets_path_mode, new_dir=out_dir)
+
+    # Write material file (format follows the .usda/.usd suffix)
+    new_stage.GetRootLayer().Export(export_path)
+
+    # Optionally create a small preview scene with a bound sphere
+    if emit_ball:
+        ball_path = os.path.join(out_dir, f"{mat_name}_ball.usda" if ascii_usd else f"{mat_name}_ball.usd")
+        # On disk from the start: the relative material reference must resolve against ball_path
+        ball_stage = Usd.Stage.CreateNew(ball_path)
+        world = ball_stage.DefinePrim("/World", "Xform")
+        ball_stage.SetDefaultPrim(world)
+        # Reference the material file under /Looks
+        looks_prim = ball_stage.DefinePrim("/Looks", "Scope")
+        # Create a target prim for the material and add a reference to the exported material prim path
+        mat_target = ball_stage.DefinePrim(f"/Looks/{mat_name}", "Material")
+        # The ball scene sits next to the material file in out_dir, so the reference is just its file name
+        mat_ref = Sdf.Reference(assetPath=os.path.basename(export_path), primPath=f"/Looks/{mat_name}")
+        mat_target.GetReferences().AddReference(mat_ref)
+
+        # Create a sphere and bind material
+        sphere = UsdGeom.Sphere.Define(ball_stage, "/World/Sphere")
+        # Give it a reasonable radius
+        sphere.CreateRadiusAttr(50.0)
+        UsdShade.MaterialBindingAPI.Apply(sphere.GetPrim()).Bind(UsdShade.Material(mat_target))
+        ball_stage.GetRootLayer().Save()
+
+
 def export_from_stage(
     stage: Usd.Stage,
     out_dir_name: str = "mdl_materials",
@@ -67,73 +123,75 @@ def export_from_stage(
     export_mode: str = "mdl",  # 'mdl' | 'preview'
     emit_ball: bool = False,
     assets_path_mode: str = "relative",  # 'relative' | 'absolute'
+    material_roots: Optional[List[str]] = None,
 ) -> List[Tuple[str, str]]:
     """Export MDL materials found in the current root layer to individual USD files.
 
+    ``material_roots`` optionally limits the search to these prim subtrees (e.g. ``["/Root/Looks"]``)
+    instead of traversing the whole stage; paths without a valid prim are skipped.
+
     Returns list of (materialPath, exportedFilePath).
     """
     results: List[Tuple[str, str]] = []
-    root_dir = os.path.dirname(stage.GetRootLayer().realPath or stage.GetRootLayer().identifier)
+    tasks: list = []
+    root_layer = stage.GetRootLayer()
+    root_id = root_layer.identifier
+    root_dir = os.path.dirname(root_layer.realPath or root_id)
+    # The PrimStack is fetched once per material, and only if a layer check needs it
+    need_stack = (not include_external) or placement == "authoring"
+    # out_dir is usually shared by many materials; create each directory once
+    ensured: set = set()
+
+    if material_roots:
+        # Nested or repeated roots would visit the same materials twice: keep only outermost roots
+        paths = list(dict.fromkeys(Sdf.Path(r) for r in material_roots))
+        outer = [p for p in paths if not any(p != o and p.HasPrefix(o) for o in paths)]
+        roots = [stage.GetPrimAtPath(p) for p in outer]
+        prims = (prim for root in roots if root for prim in Usd.PrimRange(root, Usd.PrimDefaultPredicate))
+    else:
+        prims = stage.Traverse()
 
-    for prim in stage.Traverse():
+    for prim in prims:
         if prim.GetTypeName() != "Material":
             continue
-        if (not include_external) and (not _is_in_root_layer(stage, prim)):
+        stack = _prim_stack(prim) if need_stack else []
+        if (not include_external) and (not _is_in_root_layer(stack, root_id)):
             continue
         mat = UsdShade.Material(prim)
         mdl = find_mdl_shader(mat)
         if not mdl:
             continue
 
-        # New stage for exported material
         mat_name = _sanitize_name(prim.GetName())
-        looks_path = "/Looks"
         # decide base directory per material
         if placement == "authoring":
-            base_dir = _authoring_layer_dir_for_prim(prim) or root_dir
+            base_dir = _authoring_layer_dir_for_prim(stack) or root_dir
         else:
             base_dir = root_dir
         out_dir = os.path.join(base_dir, out_dir_name)
-        _ensure_dir(out_dir)
+        if out_dir not in ensured:
+            _ensure_dir(out_dir)
+            ensured.add(out_dir)
         export_path = os.path.join(out_dir, f"{mat_name}.usda" if ascii_usd else f"{mat_name}.usd")
+        results.append((prim.GetPath().pathString, export_path))
+        tasks.append((mdl, mat_name, out_dir, export_path))
 
-        new_stage = Usd.Stage.CreateNew(export_path)
-        new_stage.SetDefaultPrim(new_stage.DefinePrim("/Root", "Scope"))
-        new_stage.DefinePrim(looks_path, "Scope")
-        new_mat = UsdShade.Material.Define(new_stage, f"{looks_path}/{mat_name}")
+    # Materials whose names sanitize to the same file: only the last one is written, as when exporting serially
+    last_for_path = {task[3]: task for task in tasks}
+    tasks = [task for task in tasks if last_for_path[task[3]] is task]
 
-        if export_mode == "preview":
-            # Build preview network and wire textures using original MDL shader as source of truth
-            ensure_preview(new_stage, new_mat)
-            filled, has_c, c_rgb, bc_tex = copy_textures(new_stage, mdl, new_mat)
-            connect_preview(new_stage, new_mat, filled, has_c, c_rgb, bc_tex)
-        else:
-            # MDL-preserving export: duplicate minimal MDL shader metadata and inputs
-            _export_mdl_material(new_stage, new_mat, mdl, assets_path_mode=assets_path_mode)
+    def _run(task) -> None:
+        _export_one(*task, ascii_usd=ascii_usd, export_mode=export_mode, emit_ball=emit_ball, assets_path_mode=assets_path_mode)
 
-        # Save material file
-        new_stage.GetRootLayer().Save()
-        results.append((prim.GetPath().pathString, export_path))
-
-        # Optionally create a small preview scene with a bound sphere
-        if emit_ball:
-            ball_path = os.path.join(out_dir, f"{mat_name}_ball.usda" if ascii_usd else f"{mat_name}_ball.usd")
-            ball_stage = Usd.Stage.CreateNew(ball_path)
-            world = ball_stage.DefinePrim("/World", "Xform")
-            ball_stage.SetDefaultPrim(world)
-            # Reference the material file under /Looks
-            looks_prim = ball_stage.DefinePrim("/Looks", "Scope")
-            # Create a target prim for the material and add a reference to the exported material prim path
-            mat_target = ball_stage.DefinePrim(f"/Looks/{mat_name}", "Material")
-            mat_ref = Sdf.Reference(assetPath=os.path.relpath(export_path, os.path.dirname(ball_path)).replace("\\", "/"), primPath=f"/Looks/{mat_name}")
-            mat_target.GetReferences().AddReference(mat_ref)
-
-            # Create a sphere and bind material
-            sphere = UsdGeom.Sphere.Define(ball_stage, "/World/Sphere")
-            # Give it a reasonable radius
-            sphere.CreateRadiusAttr(50.0)
-            UsdShade.MaterialBindingAPI.Apply(sphere.GetPrim()).Bind(UsdShade.Material(mat_target))
-            ball_stage.GetRootLayer().Save()
+    # Each task authors its own stage and files and only reads the source stage, so tasks run concurrently
+    workers = min(len(tasks), os.cpu_count() or 1)
+    if workers <= 1:
+        for task in tasks:
+            _run(task)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for fut in [pool.submit(_run, task) for task in tasks]:
+                fut.result()
 
     return results
 
@@ -141,7 +199,13 @@ def export_from_stage(
 __all__ = ["export_from_stage"]
 
 
-def _export_mdl_material(new_stage: Usd.Stage, new_mat: UsdShade.Material, mdl_shader_src: UsdShade.Shader, assets_path_mode: str = "relative"):
+def _export_mdl_material(
+    new_stage: Usd.Stage,
+    new_mat: UsdShade.Material,
+    mdl_shader_src: UsdShade.Shader,
+    assets_path_mode: str = "relative",
+    new_dir: str | None = None,
+):
     """Create a minimal MDL material on new_stage, preserving info:mdl:* metadata and inputs.
 
     Structure:
@@ -152,75 +216,79 @@ def _export_mdl_material(new_stage: Usd.Stage, new_mat: UsdShade.Material, mdl_s
           - copy info:mdl:* attributes
           - recreate outputs:surface token
           - copy inputs (value attributes) without attempting to clone connected subgraphs
+
+    ``new_dir`` is the directory the material file will be written to; relative asset paths are
+    rewritten against it. Defaults to the directory of ``new_stage``'s root layer.
     """
     parent = new_mat.GetPath().pathString
     shader_path = f"{parent}/mdlShader"
     mdl_new = UsdShade.Shader.Define(new_stage, shader_path)
 
-    # copy info:id
-    src_prim = mdl_shader_src.GetPrim()
-    id_attr = src_prim.GetAttribute("info:id")
-    if id_attr and id_attr.HasAuthoredValue():
-        mdl_new.CreateIdAttr(id_attr.Get())
-    else:
-        mdl_new.CreateIdAttr("mdlMaterial")
-
-    # copy info:mdl:* attributes and some common impl source hints
-    new_dir = os.path.dirname(new_stage.GetRootLayer().realPath or new_stage.GetRootLayer().identifier)
-    for name in src_prim.GetPropertyNames():
-        if name.startswith("info:mdl:") or name in ("info:implementationSource", "info:sourceAsset"):
-            a_src = src_prim.GetAttribute(name)
-            if not a_src:
+    # Only properties are authored below, on prims that already exist, so one change block is safe
+    # (Usd prim definition inside a block fails: the stage has not recomposed yet).
+    with Sdf.ChangeBlock():
+        # copy info:id
+        src_prim = mdl_shader_src.GetPrim()
+        id_attr = src_prim.GetAttribute("info:id")
+        if id_attr and id_attr.HasAuthoredValue():
+            mdl_new.CreateIdAttr(id_attr.Get())
+        else:
+            mdl_new.CreateIdAttr("mdlMaterial")
+
+        # fallback anchor from mdl source asset
+        mdl_sa_attr = src_prim.GetAttribute("info:mdl:sourceAsset")
+        mdl_anchor_dir = _anchor_dir_for_attr(mdl_sa_attr) if mdl_sa_attr else None
+
+        # asset path rewrite is chosen once per call from assets_path_mode
+        if assets_path_mode == "absolute":
+            def _rewrite(abs_path: str) -> Sdf.AssetPath:
+                return Sdf.AssetPath(abs_path)
+        else:
+            if new_dir is None:
+                new_dir = os.path.dirname(new_stage.GetRootLayer().realPath or new_stage.GetRootLayer().identifier)
+
+            def _rewrite(abs_path: str) -> Sdf.AssetPath:
+                return Sdf.AssetPath(os.path.relpath(abs_path, new_dir).replace("\\", "/"))
+
+        # copy info:mdl:* attributes and some common impl source hints
+        for a_src in src_prim.GetAttributes():
+            name = a_src.GetName()
+            if not (name.startswith("info:mdl:") or name in ("info:implementationSource", "info:sourceAsset")):
                 continue
             if a_src.HasAuthoredValue():
                 v = a_src.Get()
                 # Special handling for asset-valued attributes: rewrite path relative to the new file directory
                 if isinstance(v, Sdf.AssetPath):
-                    anchor_dir = _anchor_dir_for_attr(a_src)
+                    anchor_dir = mdl_anchor_dir if name == "info:mdl:sourceAsset" else _anchor_dir_for_attr(a_src)
                     abs_path = _resolve_abs_path(anchor_dir, (v.resolvedPath or v.path)) if (v and (v.resolvedPath or v.path)) else None
                     if abs_path:
-                        if assets_path_mode == "absolute":
-                            v = Sdf.AssetPath(abs_path)
-                        else:
-                            rel = os.path.relpath(abs_path, new_dir).replace("\\", "/")
-                            v = Sdf.AssetPath(rel)
+                        v = _rewrite(abs_path)
                 a_dst = mdl_new.GetPrim().CreateAttribute(name, a_src.GetTypeName())
                 a_dst.Set(v)
 
-    # outputs:surface
-    mdl_new.CreateOutput("surface", Sdf.ValueTypeNames.Token)
-
-    # copy value inputs (rewrite asset paths relative to new file)
-    new_dir = os.path.dirname(new_stage.GetRootLayer().realPath or new_stage.GetRootLayer().identifier)
-    # fallback anchor from mdl source asset
-    mdl_sa_attr = src_prim.GetAttribute("info:mdl:sourceAsset")
-    mdl_anchor_dir = _anchor_dir_for_attr(mdl_sa_attr) if mdl_sa_attr else None
-    for inp in mdl_shader_src.GetInputs():
-        i_dst = mdl_new.CreateInput(inp.GetBaseName(), inp.GetTypeName())
-        try:
-            val = inp.Get()
-            if isinstance(val, Sdf.AssetPath):
-                # find anchor dir for this input attribute on the source prim
-                attr = src_prim.GetAttribute(f"inputs:{inp.GetBaseName()}")
-                anchor_dir = _anchor_dir_for_attr(attr) if attr else None
-                if not anchor_dir:
-                    anchor_dir = mdl_anchor_dir
-                abs_path = _resolve_abs_path(anchor_dir, (val.resolvedPath or val.path)) if (val and (val.resolvedPath or val.path)) else None
-                if abs_path:
-                    if assets_path_mode == "absolute":
-                        i_dst.Set(Sdf.AssetPath(abs_path))
+        # outputs:surface
+        mdl_new.CreateOutput("surface", Sdf.ValueTypeNames.Token)
+
+        # copy value inputs (rewrite asset paths relative to new file)
+        for inp in mdl_shader_src.GetInputs():
+            i_dst = mdl_new.CreateInput(inp.GetBaseName(), inp.GetTypeName())
+            try:
+                val = inp.Get()
+                if isinstance(val, Sdf.AssetPath):
+                    # find anchor dir for this input attribute on the source prim (the input is that attribute)
+                    anchor_dir = _anchor_dir_for_attr(inp.GetAttr()) or mdl_anchor_dir
+                    abs_path = _resolve_abs_path(anchor_dir, (val.resolvedPath or val.path)) if (val and (val.resolvedPath or val.path)) else None
+                    if abs_path:
+                        i_dst.Set(_rewrite(abs_path))
                     else:
-                        rel = os.path.relpath(abs_path, new_dir).replace("\\", "/")
-                        i_dst.Set(Sdf.AssetPath(rel))
+                        i_dst.Set(val)
                 else:
-                    i_dst.Set(val)
-            else:
-                # For non-asset values, set directly if authored
-                if val is not None:
-                    i_dst.Set(val)
-        except Exception:
-            pass
-
-    # connect material outputs:surface:mdl
-    out_mdl = new_mat.GetSurfaceOutput("mdl") or new_mat.CreateSurfaceOutput("mdl")
-    out_mdl.ConnectToSource(mdl_new.GetOutput("surface"))
+                    # For non-asset values, set directly if authored
+                    if val is not None:
+                        i_dst.Set(val)
+            except Exception:
+                pass
+
+        # connect material outputs:surface:mdl
+        out_mdl = new_mat.GetSurfaceOutput("mdl") or new_mat.CreateSurfaceOutput("mdl")
+        out_mdl.ConnectToSource(mdl_new.GetOutput("surface"))
@@ -3,20 +3,38 @@
 High-level USD to GLB converter logic.
 Traverses a USD stage, extracts geometry/material, and drives the GlbWriter.
 """
+import hashlib
+
 from pxr import Usd, UsdGeom, Gf
 
 from .writer import GlbWriter
 from .usd_scene import UsdSceneGraphBuilder
-from .usd_mesh import UsdMeshExtractor
+from .usd_mesh import UsdMeshExtractor, optimize_mesh_for_gpu
 from .usd_material import UsdMaterialExtractor
 from .texture_utils import process_texture, pack_metallic_roughness
 
+# Z-up -> Y-up：绕 X 轴 -90 度，即 (x, y, z) -> (x, z, -y)。
+# 直接写出精确矩阵，避免 Gf.Rotation 的 cos(-90°) 留下 2.2e-16 级别的噪声写入 root 节点。
+Z_UP_TO_Y_UP = Gf.Matrix4d(
+    1.0, 0.0, 0.0, 0.0,
+    0.0, 0.0, -1.0, 0.0,
+    0.0, 1.0, 0.0, 0.0,
+    0.0, 0.0, 0.0, 1.0,
+)
+
 class UsdToGlbConverter:
     """
     USD 到 GLB 转换器的主类。
     负责协调整个转换流程：初始化写入器、遍历 USD 场景、提取数据并写入 GLB。
+
+    注意：optimize_for_gpu 默认为 True。一旦环境中安装了 meshoptimizer，
+    输出 GLB 中每个 mesh 的三角形顺序和顶点顺序都会被静默重排，未被索引引用的顶点会被丢弃
+    （几何外观不变）。依赖原始顶点顺序/顶点数的下游请传 optimize_for_gpu=False。
     """
-    def __init__(self):
+    def __init__(self, optimize_for_gpu=True):
+        # 是否在写出前用 meshoptimizer（可选依赖）重排索引/顶点以提高 GPU 缓存命中率
+        # CPU 侧消费或需要保留原始顶点顺序时可关闭
+        self.optimize_for_gpu = optimize_for_gpu
         # 初始化 GLB 写入器，用于构建最终的二进制文件结构
         self.writer = GlbWriter()
         # 根变换矩阵，用于处理坐标系转换（通常是从 USD 的 Z-up 转为 GLTF 的 Y-up）
@@ -24,10 +42,18 @@ class UsdToGlbConverter:
         self.root_transform = Gf.Matrix4d(1.0)
         
         # 图片缓存，用于防止重复处理相同的纹理文件
-        # 键为文件路径或唯一标识符，值为在 GLB 中的 image 索引
+        # 键为纹理文件内容摘要（见 _texture_key）或唯一标识符，值为在 GLB 中的 image 索引
         self._image_cache = {}
+        # 文件路径 -> 内容摘要，同一路径只读取/哈希一次
+        self._file_digests = {}
+        # Metallic/Roughness 打包图缓存，与单张纹理的 _image_cache 分开
+        # 键为 (metal 内容键, rough 内容键)，值为 image 索引
+        self._mr_cache = {}
+        # 材质缓存：键为 USD 材质 Prim 路径，值为 GLB material 索引（无 PreviewSurface 时为 None）
+        # 多个 mesh 共享同一材质时，着色器遍历、纹理处理和 add_material 只做一次
+        self._material_cache = {}
 
-    def _get_image_index(self, key, loader_func, *args):
+    def _get_image_index(self, key, loader_func, *args, cache=None):
         """
         辅助函数：处理图片的加载和缓存。
         
@@ -35,16 +61,19 @@ class UsdToGlbConverter:
             key: 缓存键（通常是文件路径）。
             loader_func: 加载图片的函数（如 process_texture），需返回 (bytes, mime_type)。
             *args: 传递给 loader_func 的参数。
+            cache: 使用的缓存字典，默认为 self._image_cache。
             
         Returns:
             int: GLB 中的 image 索引，如果加载失败则返回 None。
         """
         if not key:
             return None
+        if cache is None:
+            cache = self._image_cache
             
         # 如果该图片已经处理过，直接返回缓存的索引
-        if key in self._image_cache:
-            return self._image_cache[key]
+        if key in cache:
+            return cache[key]
             
         # 调用加载函数处理图片
         result = loader_func(*args)
@@ -53,10 +82,36 @@ class UsdToGlbConverter:
             # 将图片数据添加到 GLB 写入器中，并获取其索引
             idx = self.writer.add_image(img_bytes, mime_type=mime)
             # 存入缓存
-            self._image_cache[key] = idx
+            cache[key] = idx
             return idx
         return None
 
+    def _texture_key(self, file_path):
+        """
+        以文件内容作为纹理缓存键。
+
+        同一张图经由不同路径引用（符号链接、"./a.png" 与 "a.png"、复制出的同内容文件）时
+        得到相同的键，从而只解码一次，并在 GLB 中只写入一份图片数据。
+        对整个文件做 blake2b，而不是只取文件头：只比较前缀会把前缀相同的不同纹理错误合并。
+
+        Returns:
+            bytes: 内容摘要；文件无法读取时退回为路径本身（由加载函数报告缺失）。None 表示无路径。
+        """
+        if not file_path:
+            return None
+        if file_path in self._file_digests:
+            return self._file_digests[file_path]
+        try:
+            h = hashlib.blake2b(digest_size=16)
+            with open(file_path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    h.update(chunk)
+            key = h.digest()
+        except OSError:
+            key = file_path
+        self._file_digests[file_path] = key
+        return key
+
     def process_stage(self, src_usd_path, out_glb_path):
         """
         转换的主入口点。
@@ -69,6 +124,9 @@ class UsdToGlbConverter:
         self.writer = GlbWriter()
         self.root_transform = Gf.Matrix4d(1.0)
         self._image_cache = {}
+        self._file_digests = {}
+        self._mr_cache = {}
+        self._material_cache = {}
 
         # 1. 打开 USD 舞台 (Stage)
         stage = Usd.Stage.Open(src_usd_path)
@@ -81,8 +139,7 @@ class UsdToGlbConverter:
         
         # GLTF 标准使用 Y-up。如果 USD 是 Z-up，我们需要绕 X 轴旋转 -90 度来对齐。
         if up_axis == 'Z':
-            rot = Gf.Rotation(Gf.Vec3d(1, 0, 0), -90)
-            self.root_transform = Gf.Matrix4d(rot, Gf.Vec3d(0))
+            self.root_transform = Z_UP_TO_Y_UP
         
         # 3. 提取并写出场景层级
         scene_nodes = UsdSceneGraphBuilder.build(stage, root_transform=self.root_transform)
@@ -135,52 +192,20 @@ class UsdToGlbConverter:
         mesh_data = UsdMeshExtractor.extract_mesh_data(usd_mesh)
         if not mesh_data:
             return None  # 如果提取失败（例如非三角形网格），则跳过
+        if self.optimize_for_gpu:
+            # 未安装 meshoptimizer 时为 no-op
+            mesh_data = optimize_mesh_for_gpu(mesh_data)
 
-        # 2. 提取材质数据
+        # 2. 提取材质数据（按材质 Prim 路径缓存）
         mat_idx = None
-        mat_data = UsdMaterialExtractor.extract_material_data(usd_mesh)
-        
-        if mat_data:
-            # 获取纹理路径字典
-            textures = mat_data["textures"]
-            bc_path = textures.get("diffuse")
-            rough_path = textures.get("roughness")
-            metal_path = textures.get("metallic")
-            norm_path = textures.get("normal")
-
-            # 处理 BaseColor 纹理
-            bc_tex_idx = None
-            if bc_path:
-                img_idx = self._get_image_index(bc_path, process_texture, bc_path)
-                if img_idx is not None:
-                    bc_tex_idx = self.writer.add_texture(img_idx)
-            
-            # 处理 Metallic/Roughness 纹理
-            # GLTF 需要将二者打包到同一张图的 B 和 G 通道
-            mr_tex_idx = None
-            if rough_path or metal_path:
-                # 使用组合键作为缓存键
-                key = f"MR_{metal_path}_{rough_path}"
-                img_idx = self._get_image_index(key, pack_metallic_roughness, metal_path, rough_path)
-                if img_idx is not None:
-                    mr_tex_idx = self.writer.add_texture(img_idx)
-                    
-            # 处理法线贴图
-            norm_tex_idx = None
-            if norm_path:
-                img_idx = self._get_image_index(norm_path, process_texture, norm_path)
-                if img_idx is not None:
-                    norm_tex_idx = self.writer.add_texture(img_idx)
-            
-            # 将材质添加到写入器，并获取索引
-            mat_idx = self.writer.add_material(
-                base_color=mat_data["base_color"], 
-                metallic=mat_data["metallic"], 
-                roughness=mat_data["roughness"],
-                base_color_texture=bc_tex_idx,
-                metallic_roughness_texture=mr_tex_idx,
-                normal_texture=norm_tex_idx
-            )
+        usd_mat = UsdMaterialExtractor.find_bound_material(usd_mesh)
+        if usd_mat:
+            mat_key = usd_mat.GetPath()
+            if mat_key in self._material_cache:
+                mat_idx = self._material_cache[mat_key]
+            else:
+                mat_idx = self._convert_material(usd_mat)
+                self._material_cache[mat_key] = mat_idx
 
         # 3. 将网格数据添加到写入器
         return self.writer.add_mesh(
@@ -191,3 +216,58 @@ class UsdToGlbConverter:
             indices=mesh_data["indices"],
             material_index=mat_idx
         )
+
+    def _convert_material(self, usd_mat):
+        """
+        将 UsdShade.Material 转换为 GLB material（含纹理）。
+
+        Args:
+            usd_mat: UsdShade.Material 对象。
+
+        Returns:
+            int: GLB material 索引；如果没有 UsdPreviewSurface 则返回 None。
+        """
+        mat_data = UsdMaterialExtractor.extract_from_material(usd_mat)
+        if not mat_data:
+            return None
+
+        # 获取纹理路径字典
+        textures = mat_data["textures"]
+        bc_path = textures.get("diffuse")
+        rough_path = textures.get("roughness")
+        metal_path = textures.get("metallic")
+        norm_path = textures.get("normal")
+
+        # 处理 BaseColor 纹理
+        bc_tex_idx = None
+        if bc_path:
+            img_idx = self._get_image_index(self._texture_key(bc_path), process_texture, bc_path)
+            if img_idx is not None:
+                bc_tex_idx = self.writer.add_texture(img_idx)
+
+        # 处理 Metallic/Roughness 纹理
+        # GLTF 需要将二者打包到同一张图的 B 和 G 通道
+        mr_tex_idx = None
+        if rough_path or metal_path:
+            # 使用两张源图的内容键组合作为缓存键（独立的 _mr_cache）
+            key = (self._texture_key(metal_path), self._texture_key(rough_path))
+            img_idx = self._get_image_index(key, pack_metallic_roughness, metal_path, rough_path, cache=self._mr_cache)
+            if img_idx is not None:
+                mr_tex_idx = self.writer.add_texture(img_idx)
+
+        # 处理法线贴图
+        norm_tex_idx = None
+        if norm_path:
+            img_idx = self._get_image_index(self._texture_key(norm_path), process_texture, norm_path)
+            if img_idx is not None:
+                norm_tex_idx = self.writer.add_texture(img_idx)
+
+        # 将材质添加到写入器，并获取索引
+        return self.writer.add_material(
+            base_color=mat_data["base_color"], 
+            metallic=mat_data["metallic"], 
+            roughness=mat_data["roughness"],
+            base_color_texture=bc_tex_idx,
+            metallic_roughness_texture=mr_tex_idx,
+            normal_texture=norm_tex_idx
+        )
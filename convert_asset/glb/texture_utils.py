@@ -7,9 +7,29 @@ import os
 from io import BytesIO
 from PIL import Image
 
+def _sniff_web_mime(raw):
+    """根据文件头魔数识别 glTF 可直接使用的图片格式，返回 MIME 类型或 None。"""
+    if raw.startswith(b'\x89PNG\r\n\x1a\n'):
+        return "image/png"
+    if raw.startswith(b'\xff\xd8\xff'):
+        return "image/jpeg"
+    return None
+
+def _is_complete(raw, mime):
+    """透传前校验字节完整性：PNG 用 verify() 校验分块 CRC（不解码像素），JPEG 检查 EOI 结束标记。"""
+    if mime == "image/jpeg":
+        return raw.endswith(b'\xff\xd9')
+    try:
+        # verify() 之后图像对象不可再用，所以单独打开一次
+        with Image.open(BytesIO(raw)) as img:
+            img.verify()
+        return True
+    except Exception:
+        return False
+
 def process_texture(file_path):
     """
-    读取图像文件并转换为 PNG 字节流。
+    读取图像文件并转换为 PNG 字节流（RGB/RGBA 的 PNG/JPEG 直接透传原始字节）。
     
     Args:
         file_path: 图像文件的绝对路径。
@@ -26,7 +46,16 @@ def process_texture(file_path):
         return None
         
     try:
-        with Image.open(file_path) as img:
+        with open(file_path, "rb") as f:
+            raw = f.read()
+        with Image.open(BytesIO(raw)) as img:
+            # glTF 原生支持 PNG/JPEG：已是 RGB/RGBA 时直接透传原始字节，省去一次解码+重新编码
+            # （Image.open 只解析文件头，此处不会解码像素；截断/损坏的文件不透传，
+            #  走下面的解码路径，由解码报错跳过该纹理）
+            mime = _sniff_web_mime(raw)
+            if mime and img.mode in ('RGB', 'RGBA') and _is_complete(raw, mime):
+                return raw, mime
+
             # 确保图像格式兼容 (转换为 RGB 或 RGBA)
             if img.mode != 'RGBA' and img.mode != 'RGB':
                 img = img.convert('RGB')
@@ -92,8 +121,9 @@ def pack_metallic_roughness(metal_path, rough_path):
         packed = Image.merge('RGB', (r_ch, g_ch, b_ch))
         
         # 导出为 PNG 字节流
+        # PNG 编码是打包的主要耗时：compress_level=1 编码约快 5 倍，文件约大 20%，像素无损不变
         buf = BytesIO()
-        packed.save(buf, format="PNG")
+        packed.save(buf, format="PNG", compress_level=1)
         img_bytes = buf.getvalue()
         
         return img_bytes, "image/png"
@@ -20,12 +20,33 @@ class UsdMaterialExtractor:
             None: 如果未绑定材质或未找到 UsdPreviewSurface。
         """
         # 1. 查找绑定的材质
-        # 使用 MaterialBindingAPI 计算当前 Mesh 绑定的材质
+        mat = UsdMaterialExtractor.find_bound_material(usd_mesh)
+        if not mat:
+            return None
+        return UsdMaterialExtractor.extract_from_material(mat)
+
+    @staticmethod
+    def find_bound_material(usd_mesh):
+        """
+        使用 MaterialBindingAPI 计算当前 Mesh 绑定的材质。
+
+        Returns:
+            UsdShade.Material: 绑定的材质；未绑定时返回 None。
+        """
         bound = UsdShade.MaterialBindingAPI(usd_mesh).ComputeBoundMaterial()
         if not bound or not bound[0]:
             return None
-            
-        mat = bound[0]
+        return bound[0]
+
+    @staticmethod
+    def extract_from_material(mat):
+        """
+        从已知的 UsdShade.Material 提取参数（不涉及绑定查找）。
+
+        Returns:
+            dict: 同 extract_material_data。
+            None: 如果未找到 UsdPreviewSurface。
+        """
         # 2. 查找 UsdPreviewSurface 着色器
         # 我们假设材质网络中包含一个 id 为 "UsdPreviewSurface" 的 Shader Prim
         shader = None
@@ -47,6 +68,10 @@ class UsdMaterialExtractor:
         # metallic: 金属度 (Float)
         metal = shader.GetInput("metallic").Get()
         
+        # 相对纹理路径的锚点：根层目录，每个材质只查询一次
+        layer_path = mat.GetPrim().GetStage().GetRootLayer().realPath
+        layer_dir = os.path.dirname(layer_path) if layer_path else None
+
         # 辅助函数：获取纹理路径
         def get_tex_path(input_name):
             """
@@ -54,39 +79,7 @@ class UsdMaterialExtractor:
             """
             inp = shader.GetInput(input_name)
             if inp and inp.HasConnectedSource():
-                  # 获取连接源列表
-                  connections = inp.GetConnectedSources()
-                  if connections:
-                       # 稳健地解包嵌套列表结构 (在某些 USD 版本或复杂网络中出现)
-                       # 例如: [[Info], []] 或 [Info]
-                       val = connections[0]
-                       if isinstance(val, list) and len(val) > 0:
-                           val = val[0]
-
-                       if hasattr(val, "source"): # UsdShadeConnectionSourceInfo
-                             # source 可能是 ConnectableAPI, Usd.Prim 或 SdfPath
-                             s = val.source
-                             src = None
-                             if isinstance(s, Usd.Prim):
-                                 src = s
-                             elif hasattr(s, "GetPrim"):
-                                 src = s.GetPrim()
-                             elif hasattr(s, "prim"):
-                                 src = s.prim
-                             
-                             if src:
-                                 pass # 已找到源 Prim
-                             else:
-                                 pass # 无法解析源 Prim
-                             
-                             src_name = val.sourceName
-                       elif isinstance(val, (list, tuple)) and len(val) >= 2:
-                            # 备用逻辑：如果结构不同（例如旧版 API 返回元组）
-                            pass
-                       else:
-                            pass
-
-                  # 再次尝试 GetConnectedSource (单数形式)，它是更高级的 API
+                  # GetConnectedSource (单数形式) 是更高级的 API
                   # 返回 (sourceConnectable, sourceOutputName)
                   res = inp.GetConnectedSource()
                   src = None
@@ -121,9 +114,8 @@ class UsdMaterialExtractor:
                           # 解析相对路径
                           # 如果路径不是绝对路径，假设它相对于当前层 (Layer)
                           if path and not os.path.isabs(path):
-                              layer_path = src.GetStage().GetRootLayer().realPath
-                              if layer_path:
-                                  path = os.path.join(os.path.dirname(layer_path), path)
+                              if layer_dir:
+                                  path = os.path.join(layer_dir, path)
                           return path
             return None
 
@@ -6,6 +6,13 @@ USD 网格提取模块。
 import numpy as np
 from pxr import UsdGeom
 
+try:  # 可选依赖：未安装 meshoptimizer 时跳过 GPU 顶点缓存优化
+    import meshoptimizer as _meshopt  # type: ignore
+except Exception:  # pragma: no cover
+    _meshopt = None
+
+HAVE_MESHOPTIMIZER = _meshopt is not None
+
 class UsdMeshExtractor:
     @staticmethod
     def extract_mesh_data(usd_mesh):
@@ -25,7 +32,8 @@ class UsdMeshExtractor:
         if not counts:
             return None
             
-        counts_np = np.array(counts)
+        # 零拷贝视图（VtIntArray 支持 buffer 协议），只做一次 ==3 归约，不再先复制整个数组
+        counts_np = np.asarray(counts, dtype=np.int32)
         # 如果存在任何非三角形面（顶点数不为3），则跳过
         # GLB 要求网格必须是三角化的
         if not np.all(counts_np == 3):
@@ -37,15 +45,15 @@ class UsdMeshExtractor:
         if not points:
             return None
         
-        # 转换为 numpy (N, 3) float32 格式
-        points_np = np.array(points, dtype=np.float32)
+        # 转换为 numpy (N, 3) float32 格式：VtVec3fArray 支持 buffer 协议，asarray 为零拷贝视图
+        points_np = np.asarray(points, dtype=np.float32)
         
         # 3. 提取法线 (Normals)
         normals_np = None
         normals = usd_mesh.GetNormalsAttr().Get()
         # 仅处理顶点法线 (Vertex Normals)，即数量与顶点数一致的情况
         if normals and len(normals) == len(points): 
-            normals_np = np.array(normals, dtype=np.float32)
+            normals_np = np.asarray(normals, dtype=np.float32)
 
         # 4. 提取 UV (primvars:st)
         uvs_np = None
@@ -57,10 +65,12 @@ class UsdMeshExtractor:
         
         if st_pv and st_pv.HasValue():
             # 获取 UV 数据和索引
-            uv_data = np.array(st_pv.Get(), dtype=np.float32)
+            # VtVec2fArray / VtIntArray 支持 buffer 协议：asarray 直接得到 (N,2) float32 / int32 视图，
+            # 后续 uv_data[uv_indices] 的 gather 在 C 层一次完成
+            uv_data = np.asarray(st_pv.Get(), dtype=np.float32)
             uv_indices = st_pv.GetIndices()
             if uv_indices:
-                uv_indices = np.array(uv_indices, dtype=np.uint32)
+                uv_indices = np.asarray(uv_indices, dtype=np.int32)
                 
             # 检查插值方式
             interp = st_pv.GetInterpolation()
@@ -79,7 +89,7 @@ class UsdMeshExtractor:
         
         # 5. 提取索引 (Indices)
         indices = usd_mesh.GetFaceVertexIndicesAttr().Get()
-        indices_np = np.array(indices, dtype=np.uint32) # 标准化为 uint32
+        indices_np = np.asarray(indices, dtype=np.uint32) # 标准化为 uint32（一次 C 层 int32->uint32 转换）
         
         # 处理 FaceVarying UV 的展平逻辑 (Mesh Flattening)
         if needs_flattening:
@@ -116,3 +126,48 @@ class UsdMeshExtractor:
             "uvs": uvs_np,
             "indices": indices_np
         }
+
+
+def optimize_mesh_for_gpu(mesh_data):
+    """
+    用 meshoptimizer 重排三角形与顶点，提高 GPU 端 post-transform cache 命中率与顶点读取局部性。
+
+    先 optimize_vertex_cache 重排索引，再用 optimize_vertex_fetch_remap 按首次使用顺序重排顶点，
+    positions/normals/uvs 随之重映射（未被索引引用的顶点被丢弃）。几何与拓扑不变，只改变顺序。
+
+    Args:
+        mesh_data: extract_mesh_data 返回的字典。
+
+    Returns:
+        dict: 重排后的新字典；未安装 meshoptimizer、数据为空或索引越界时原样返回。
+    """
+    if _meshopt is None or not mesh_data:
+        return mesh_data
+    positions = mesh_data["positions"]
+    indices = mesh_data["indices"]
+    n_verts = len(positions)
+    if n_verts == 0 or indices is None or len(indices) == 0:
+        return mesh_data
+    # C 扩展不做越界检查：索引越界（或为负）的异常 mesh 直接跳过，保持原样
+    if int(np.min(indices)) < 0 or int(np.max(indices)) >= n_verts:
+        return mesh_data
+
+    indices = np.ascontiguousarray(indices, dtype=np.uint32)
+    cache_opt = np.empty_like(indices)
+    _meshopt.optimize_vertex_cache(cache_opt, indices, len(indices), n_verts)
+
+    # remap[旧顶点] = 新顶点；未使用的顶点为 ~0u
+    remap = np.empty(n_verts, dtype=np.uint32)
+    unique = int(_meshopt.optimize_vertex_fetch_remap(remap, cache_opt, len(cache_opt), n_verts))
+    used = remap != np.uint32(0xFFFFFFFF)
+    order = np.empty(unique, dtype=np.intp)
+    order[remap[used]] = np.nonzero(used)[0]
+
+    out = dict(mesh_data)
+    out["indices"] = remap[cache_opt]
+    for key in ("positions", "normals", "uvs"):
+        arr = out[key]
+        # 只重映射逐顶点数组；长度不匹配的数据（已告警的异常 UV）保持原样
+        if arr is not None and len(arr) == n_verts:
+            out[key] = arr[order]
+    return out
@@ -11,11 +11,14 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import numpy as np
 from pxr import Gf, Usd, UsdGeom
 
 
 SYNTHETIC_ROOT_KEY = "__synthetic_root__"
 SYNTHETIC_ROOT_NAME = "__RootTransform__"
+# Shared identity for per-prim "has a local transform?" checks (no Matrix4d built per prim).
+IDENTITY_MATRIX = Gf.Matrix4d(1.0)
 
 
 @dataclass(frozen=True)
@@ -34,7 +37,7 @@ class UsdSceneGraphBuilder:
     """Build a glTF-oriented node tree from a USD stage."""
 
     @staticmethod
-    def build(stage, root_transform=Gf.Matrix4d(1.0)):
+    def build(stage, root_transform=IDENTITY_MATRIX):
         """
         Build an ordered list of scene nodes for export.
 
@@ -49,7 +52,7 @@ class UsdSceneGraphBuilder:
         )
 
         nodes = []
-        has_synthetic_root = root_transform != Gf.Matrix4d(1.0)
+        has_synthetic_root = root_transform != IDENTITY_MATRIX
         if has_synthetic_root:
             nodes.append(
                 SceneNodeDesc(
@@ -68,7 +71,7 @@ class UsdSceneGraphBuilder:
             xformable = UsdGeom.Xformable(prim)
             local_matrix = xformable.GetLocalTransformation()
             matrix = None
-            if local_matrix != Gf.Matrix4d(1.0):
+            if local_matrix != IDENTITY_MATRIX:
                 matrix = UsdSceneGraphBuilder.gf_matrix_to_gltf_matrix(local_matrix)
 
             parent_key = UsdSceneGraphBuilder._find_parent_key(prim, export_keys)
@@ -95,9 +98,10 @@ class UsdSceneGraphBuilder:
 
         USD matrices here are consumed in row-vector form; glTF stores matrices
         in column-major order. Flattening the USD matrix row-by-row yields the
-        equivalent glTF JSON array.
+        equivalent glTF JSON array. The row-major buffer view of the Gf matrix
+        gives the same 16 floats without indexing each element from Python.
         """
-        return [float(matrix[row][col]) for row in range(4) for col in range(4)]
+        return np.asarray(matrix, dtype=np.float64).ravel().tolist()
 
     @staticmethod
     def _iter_exportable_mesh_prims(stage):
@@ -4,7 +4,9 @@
 This module exposes thin, stable entrypoints:
 
 - simplify_mesh_with_cpp: legacy path using external meshqem executable
-    via temporary OBJ files (geometry only).
+    via temporary OBJ files (geometry only). Its USD-free middle step,
+    run_cpp_on_tri_mesh, is exposed so callers can run meshes concurrently
+    and write back with write_tri_mesh_to_prim.
 - simplify_mesh_with_cpp_uv: in-memory path using optional `meshqem_py`
     pybind11 bindings with face-varying UV triplets.
 
@@ -40,25 +42,22 @@ from .backend_cpp_impl import (
 )
 
 
-def simplify_mesh_with_cpp(
-    prim: Any,
+def run_cpp_on_tri_mesh(
+    points: list[tuple[float, float, float]],
+    faces: list[tuple[int, int, int]],
     exe_path: str,
     ratio: float | None = None,
     target_faces: int | None = None,
     max_collapses: int | None = None,
     time_limit: float | None = None,
     progress_interval: int = 20000,
-        apply: bool = True,
-        show_output: bool = False,
-) -> tuple[int, int, int, int]:
-    if Usd is None or UsdGeom is None:
-        raise RuntimeError("pxr.Usd not available; run inside Isaac/pxr environment")
-
-    mesh = UsdGeom.Mesh(prim)
-    points, faces = extract_tri_mesh_from_prim(prim)
-    if not points or not faces:
-        return (0, 0, 0, 0)
+    show_output: bool = False,
+) -> tuple[list[tuple[float, float, float]], list[tuple[int, int, int]]]:
+    """Run meshqem on extracted triangles via temporary OBJ files.
 
+    Touches no USD objects, so independent meshes can run on worker threads;
+    write results back with `write_tri_mesh_to_prim` on the stage's thread.
+    """
     with tempfile.TemporaryDirectory() as td:
         inp = os.path.join(td, "in.obj")
         out = os.path.join(td, "out.obj")
@@ -74,19 +73,60 @@ def simplify_mesh_with_cpp(
             progress_interval=progress_interval,
             show_output=show_output,
         )
+        return read_obj_tri(out)
+
+
+def write_tri_mesh_to_prim(
+    prim: Any,
+    points: list[tuple[float, float, float]],
+    faces: list[tuple[int, int, int]],
+) -> None:
+    if Usd is None or UsdGeom is None:
+        raise RuntimeError("pxr.Usd not available; run inside Isaac/pxr environment")
+    mesh = UsdGeom.Mesh(prim)
+    mesh.GetPointsAttr().Set(points)
+    counts2 = [3] * len(faces)
+    idx2: list[int] = []
+    for a, b, c in faces:
+        idx2.extend([int(a), int(b), int(c)])
+    mesh.GetFaceVertexCountsAttr().Set(counts2)
+    mesh.GetFaceVertexIndicesAttr().Set(idx2)
+
+
+def simplify_mesh_with_cpp(
+    prim: Any,
+    exe_path: str,
+    ratio: float | None = None,
+    target_faces: int | None = None,
+    max_collapses: int | None = None,
+    time_limit: float | None = None,
+    progress_interval: int = 20000,
+        apply: bool = True,
+        show_output: bool = False,
+) -> tuple[int, int, int, int]:
+    if Usd is None or UsdGeom is None:
+        raise RuntimeError("pxr.Usd not available; run inside Isaac/pxr environment")
+
+    points, faces = extract_tri_mesh_from_prim(prim)
+    if not points or not faces:
+        return (0, 0, 0, 0)
+
+    new_pts, new_faces = run_cpp_on_tri_mesh(
+        points,
+        faces,
+        exe_path,
+        ratio=ratio,
+        target_faces=target_faces,
+        max_collapses=max_collapses,
+        time_limit=time_limit,
+        progress_interval=progress_interval,
+        show_output=show_output,
+    )
+    if apply:
+        # write back
+        write_tri_mesh_to_prim(prim, new_pts, new_faces)
 
-        new_pts, new_faces = read_obj_tri(out)
-        if apply:
-            # write back
-            mesh.GetPointsAttr().Set(new_pts)
-            counts2 = [3] * len(new_faces)
-            idx2: list[int] = []
-            for a, b, c in new_faces:
-                idx2.extend([int(a), int(b), int(c)])
-            mesh.GetFaceVertexCountsAttr().Set(counts2)
-            mesh.GetFaceVertexIndicesAttr().Set(idx2)
-
-        return (len(faces), len(new_faces), len(points), len(new_pts))
+    return (len(faces), len(new_faces), len(points), len(new_pts))
 
 
 def simplify_mesh_with_cpp_uv(
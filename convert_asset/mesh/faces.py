@@ -9,7 +9,7 @@
 - 面数 = `faceVertexCounts` 的条目数（不展开/打平，不验证是否三角）。
 
 注意事项：
-- USD 的遍历会访问实例视图（Instance Proxy）。为避免对同一原型/实例重复统计，我们显式跳过 `prim.IsInstanceProxy()`。
+- 遍历使用 `Usd.PrimDefaultPredicate`：不进入实例内部访问实例视图（Instance Proxy），因此不会对同一原型/实例重复统计。
 - 该实现不做“去重”或“合并原型”的复杂逻辑，只是严格按照遍历遇到的有效 Mesh（非 Proxy/Guide）累加其 `faceVertexCounts` 的长度。
 - 需要在含有 `pxr` 的环境下运行（例如 Isaac Sim）。
 """
@@ -49,12 +49,8 @@ def count_mesh_faces(stage_or_path: str | Any) -> int:
         raise RuntimeError(f"Failed to open USD stage: {stage_or_path}")
 
     total = 0  # 面数累计
-    for prim in stage.Traverse():  # 深度优先遍历组合层次；不打平、不过滤变体等
-        if not prim.IsActive():
-            continue
-        if prim.IsInstanceProxy():
-            # 避免对原型与实例的双重计数（Instance Proxy 是原型的实例视图）
-            continue
+    # 默认谓词在 C++ 侧剪掉非激活子树，且不进入实例内部（不产生 Instance Proxy），避免原型与实例双重计数
+    for prim in Usd.PrimRange.Stage(stage, Usd.PrimDefaultPredicate):  # 深度优先遍历组合层次；不打平、不过滤变体等
         if prim.GetTypeName() != "Mesh":
             continue
         # purpose 过滤（可选）：proxy/guide 通常不参与渲染统计
@@ -62,9 +62,8 @@ def list_mesh_face_counts(stage_or_path: str | Any) -> list[tuple[str, int]]:  #
     if stage is None:  # 打不开则报错（路径错误或权限不足等）
         raise RuntimeError(f"Failed to open stage: {stage_or_path}")
     out: list[tuple[str, int]] = []  # 结果列表
-    for prim in stage.Traverse():  # 深度优先遍历整个 Stage（保持组合结构，不打平）
-        if not prim.IsActive() or prim.IsInstanceProxy():  # 跳过非激活和实例代理（避免重复统计）
-            continue
+    # 默认谓词在 C++ 侧剪掉非激活子树，且不进入实例内部（无 Instance Proxy），无需逐 Prim 判断
+    for prim in Usd.PrimRange.Stage(stage, Usd.PrimDefaultPredicate):  # 深度优先遍历整个 Stage（保持组合结构，不打平）
         if prim.GetTypeName() != "Mesh":  # 仅处理 Mesh 类型的 Prim
             continue
         img = UsdGeom.Imageable(prim)  # 转为 Imageable 以便获取 purpose
@@ -103,9 +102,7 @@ def simplify_stage_meshes(
     # 收集每个网格的新几何 (prim, verts, faces, optional face_varying_uv_triplets)
     mesh_edits: list[tuple[Any, list[tuple[float, float, float]], list[tuple[int, int, int]], Optional[list[tuple[float, float, float, float, float, float]]]]] = []
 
-    for prim in stage.Traverse():  # 遍历所有 Prim
-        if not prim.IsActive() or prim.IsInstanceProxy():  # 跳过非激活/实例代理
-            continue
+    for prim in Usd.PrimRange.Stage(stage, Usd.PrimDefaultPredicate):  # 遍历所有 Prim（谓词已跳过非激活/实例代理）
         if prim.GetTypeName() != "Mesh":  # 仅 Mesh
             continue
         img = UsdGeom.Imageable(prim)  # 获取 purpose
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""Headless regressions for camera framing (fit) and the source-camera memo."""
+from __future__ import annotations
+
+import math
+from pathlib import Path
+
+from pxr import Gf, Usd, UsdGeom
+
+from convert_asset.camera._source_camera import find_first_camera
+from convert_asset.camera.fit import FitParams, fit_camera_and_export
+
+
+def _write_cube_stage(path: Path, with_camera: bool = False) -> None:
+    stage = Usd.Stage.CreateNew(str(path))
+    UsdGeom.SetStageUpAxis(stage, UsdGeom.Tokens.z)
+    UsdGeom.Xform.Define(stage, "/World")
+    obj = UsdGeom.Xform.Define(stage, "/World/Obj")
+    obj.AddTranslateOp().Set(Gf.Vec3d(1.0, 2.0, 0.5))
+    UsdGeom.Cube.Define(stage, "/World/Obj/Cube").GetSizeAttr().Set(2.0)
+    if with_camera:
+        cam = UsdGeom.Camera.Define(stage, "/World/Cam")
+        xf = UsdGeom.Xformable(cam)
+        xf.AddTranslateOp().Set(Gf.Vec3d(8.0, -6.0, 3.0))
+        xf.AddRotateXYZOp().Set(Gf.Vec3f(70.0, 0.0, 50.0))
+    stage.Save()
+
+
+def _camera_world_matrix(path: Path, cam_path: str, time: float | None = None) -> Gf.Matrix4d:
+    stage = Usd.Stage.Open(str(path))
+    tc = Usd.TimeCode.Default() if time is None else Usd.TimeCode(time)
+    return UsdGeom.Xformable(stage.GetPrimAtPath(cam_path)).ComputeLocalToWorldTransform(tc)
+
+
+def test_fit_without_source_camera_frames_bbox_analytically(tmp_path: Path) -> None:
+    src = tmp_path / "scene.usda"
+    out = tmp_path / "scene_cam.usda"
+    _write_cube_stage(src)
+
+    params = FitParams(target_prim_path="/World/Obj/Cube", height_offset_mode="abs", height_offset_value=0.0)
+    result = fit_camera_and_export(str(src), str(out), params)
+
+    # World-forward fallback basis: right=+X, up=+Z, forward=+Y; unit half extents.
+    fov_h = math.radians(params.fov_h_deg)
+    fov_v = 2.0 * math.atan(math.tan(fov_h / 2.0) / params.aspect)
+    expected = max(1.0 / math.tan(fov_h / 2.0), 1.0 / math.tan(fov_v / 2.0)) * params.padding * params.backoff
+    assert math.isclose(result.distance, expected, rel_tol=1e-9)
+    assert math.isclose(result.fov_v_deg, math.degrees(fov_v), rel_tol=1e-9)
+    assert result.center == (1.0, 2.0, 0.5)
+    for got, want in zip(result.eye, (1.0, 2.0 - expected, 0.5)):
+        assert math.isclose(got, want, rel_tol=1e-9, abs_tol=1e-12)
+
+    matrix = _camera_world_matrix(out, result.camera_prim_path)
+    assert Gf.IsClose(matrix.ExtractTranslation(), Gf.Vec3d(*result.eye), 1e-9)
+    assert Gf.IsClose(matrix.TransformDir(Gf.Vec3d(0, 0, -1)), Gf.Vec3d(0, 1, 0), 1e-9)
+
+
+def test_fit_inherits_source_camera_and_avoids_name_collisions(tmp_path: Path) -> None:
+    src = tmp_path / "scene.usda"
+    _write_cube_stage(src, with_camera=True)
+    params = FitParams(target_prim_path="/World/Obj/Cube", pitch_down_deg=10.0)
+
+    first = fit_camera_and_export(str(src), str(tmp_path / "a.usda"), params)
+    second = fit_camera_and_export(str(tmp_path / "a.usda"), str(tmp_path / "b.usda"), params)
+
+    assert first.camera_prim_path == "/World/AutoCamInherit"
+    assert second.camera_prim_path == "/World/AutoCamInherit_1"
+    matrix = _camera_world_matrix(tmp_path / "b.usda", second.camera_prim_path)
+    right = matrix.TransformDir(Gf.Vec3d(1, 0, 0))
+    up = matrix.TransformDir(Gf.Vec3d(0, 1, 0))
+    assert math.isclose(right.GetLength(), 1.0, abs_tol=1e-9)
+    assert math.isclose(up.GetLength(), 1.0, abs_tol=1e-9)
+    assert math.isclose(Gf.Dot(right, up), 0.0, abs_tol=1e-9)
+
+
+def test_first_camera_memo_follows_stage_edits() -> None:
+    stage = Usd.Stage.CreateInMemory()
+    stage.DefinePrim("/World/A")
+    UsdGeom.Camera.Define(stage, "/World/B/Cam")
+    assert find_first_camera(stage).GetPath() == "/World/B/Cam"
+
+    # A foreign resync drops the memo; a camera authored earlier in traversal order wins.
+    UsdGeom.Camera.Define(stage, "/World/A/Cam")
+    assert find_first_camera(stage).GetPath() == "/World/A/Cam"
+    stage.RemovePrim("/World/A/Cam")
+    assert find_first_camera(stage).GetPath() == "/World/B/Cam"
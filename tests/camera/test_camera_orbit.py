@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+"""Headless regressions for orbit camera animation authoring."""
+from __future__ import annotations
+
+import math
+from pathlib import Path
+
+from pxr import Gf, Usd, UsdGeom
+
+from convert_asset.camera.orbit import OrbitParams, create_orbit_camera_animation_and_export, make_bbox_cache
+
+
+def _write_scene(path: Path, up_axis=UsdGeom.Tokens.z) -> None:
+    stage = Usd.Stage.CreateNew(str(path))
+    UsdGeom.SetStageUpAxis(stage, up_axis)
+    UsdGeom.Xform.Define(stage, "/World")
+    obj = UsdGeom.Xform.Define(stage, "/World/Obj")
+    obj.AddTranslateOp().Set(Gf.Vec3d(1.0, 2.0, 0.5))
+    UsdGeom.Cube.Define(stage, "/World/Obj/Cube").GetSizeAttr().Set(2.0)
+    stage.Save()
+
+
+def _frames(path: Path, cam_path: str):
+    stage = Usd.Stage.Open(str(path))
+    xf = UsdGeom.Xformable(stage.GetPrimAtPath(cam_path))
+    times = xf.GetTimeSamples()
+    return stage, [xf.ComputeLocalToWorldTransform(Usd.TimeCode(t)) for t in times]
+
+
+def test_orbit_frames_look_at_target_center(tmp_path: Path) -> None:
+    src = tmp_path / "scene.usda"
+    out = tmp_path / "orbit.usda"
+    _write_scene(src)
+    params = OrbitParams(
+        target_prim_path="/World/Obj",
+        num_shots=6,
+        vertical_steps=3,
+        vertical_sweep_deg=40.0,
+        cw_rotate=True,
+        start_deg=30.0,
+    )
+
+    cam_path = create_orbit_camera_animation_and_export(str(src), str(out), params)
+
+    stage, frames = _frames(out, cam_path)
+    assert cam_path == "/World/OrbitCam"
+    assert len(frames) == 18
+    assert stage.GetStartTimeCode() == 0 and stage.GetEndTimeCode() == 17
+    center = Gf.Vec3d(1.0, 2.0, 0.5)
+    radii = set()
+    for m in frames:
+        eye = m.ExtractTranslation()
+        fwd = m.TransformDir(Gf.Vec3d(0, 0, -1))
+        to_center = (center - eye).GetNormalized()
+        # Orientation is authored as a float quaternion by default.
+        assert math.isclose(Gf.Dot(fwd, to_center), 1.0, abs_tol=1e-6)
+        assert math.isclose(Gf.Dot(m.TransformDir(Gf.Vec3d(1, 0, 0)), Gf.Vec3d(0, 0, 1)), 0.0, abs_tol=1e-6)
+        radii.add(round((eye - center).GetLength(), 9))
+    # Azimuth and pitch rotations preserve the orbit radius.
+    assert len(radii) == 1
+
+
+def test_orbit_first_frame_starts_on_fallback_right_axis(tmp_path: Path) -> None:
+    src = tmp_path / "scene.usda"
+    out = tmp_path / "orbit.usda"
+    _write_scene(src, up_axis=UsdGeom.Tokens.y)
+
+    cam_path = create_orbit_camera_animation_and_export(
+        str(src), str(out), OrbitParams(target_prim_path="/World/Obj/Cube", num_shots=4)
+    )
+
+    _, frames = _frames(out, cam_path)
+    assert len(frames) == 4
+    offsets = [m.ExtractTranslation() - Gf.Vec3d(1.0, 2.0, 0.5) for m in frames]
+    # Y-up orbit stays in the XZ plane; quarter turns are mutually orthogonal.
+    for offset in offsets:
+        assert math.isclose(offset[1], 0.0, abs_tol=1e-9)
+    assert math.isclose(Gf.Dot(offsets[0], offsets[1]), 0.0, abs_tol=1e-9)
+    assert Gf.IsClose(offsets[0], -offsets[2], 1e-9)
+
+
+def test_orbit_reuses_open_stage_with_shared_bbox_cache(tmp_path: Path) -> None:
+    src = tmp_path / "scene.usda"
+    _write_scene(src)
+    stage = Usd.Stage.Open(str(src))
+    cache = make_bbox_cache()
+    params = OrbitParams(target_prim_path="/World/Obj", num_shots=3)
+
+    first = create_orbit_camera_animation_and_export(
+        "", str(tmp_path / "a.usda"), params, bbox_cache=cache, stage=stage
+    )
+    second = create_orbit_camera_animation_and_export(
+        "", str(tmp_path / "b.usda"), params, bbox_cache=cache, stage=stage
+    )
+
+    # The caller's stage accumulates cameras, so names keep advancing.
+    assert (first, second) == ("/World/OrbitCam", "/World/OrbitCam_1")
+    assert stage.GetPrimAtPath(second)
+    _, frames = _frames(tmp_path / "b.usda", second)
+    assert len(frames) == 3
+
+
+def test_orbit_transform_mode_authors_matrix_samples(tmp_path: Path) -> None:
+    src = tmp_path / "scene.usda"
+    _write_scene(src)
+    params = OrbitParams(target_prim_path="/World/Obj", num_shots=4, xform_op_mode="transform")
+    matrix_out = tmp_path / "matrix.usda"
+    quat_out = tmp_path / "quat.usda"
+
+    cam_path = create_orbit_camera_animation_and_export(str(src), str(matrix_out), params)
+    params.xform_op_mode = "translate_orient"
+    create_orbit_camera_animation_and_export(str(src), str(quat_out), params)
+
+    stage, matrix_frames = _frames(matrix_out, cam_path)
+    ops = UsdGeom.Xformable(stage.GetPrimAtPath(cam_path)).GetOrderedXformOps()
+    assert [op.GetOpType() for op in ops] == [UsdGeom.XformOp.TypeTransform]
+    stage, quat_frames = _frames(quat_out, cam_path)
+    ops = UsdGeom.Xformable(stage.GetPrimAtPath(cam_path)).GetOrderedXformOps()
+    assert [op.GetOpType() for op in ops] == [UsdGeom.XformOp.TypeTranslate, UsdGeom.XformOp.TypeOrient]
+    for a, b in zip(matrix_frames, quat_frames):
+        assert Gf.IsClose(a, b, 1e-6)
+
+
+def test_loop_kernel_matches_numpy_frames() -> None:
+    import numpy as np
+
+    from convert_asset.camera import _math, orbit
+
+    up = Gf.Vec3d(0, 0, 1)
+    base = Gf.Vec3d(3.0, -1.0, 0.5)
+    origin, center = Gf.Vec3d(1.0, 2.0, 0.7), Gf.Vec3d(1.0, 2.0, 0.5)
+    thetas = np.linspace(0.0, 5.0, 6)
+    pitches = [-0.3, 0.0, 0.4]
+
+    expected = orbit._orbit_frame_matrices(base, up, origin, center, thetas, pitches)
+    out = np.empty_like(expected)
+    _math.orbit_frame_matrices(
+        out,
+        orbit._as_np(base),
+        orbit._as_np(up),
+        orbit._as_np(origin),
+        orbit._as_np(center),
+        thetas,
+        np.asarray(pitches),
+        orbit._as_np(orbit._normalize(orbit._perpendicular_right(up))),
+        np.array([1.0, 0.0, 0.0]),
+    )
+    assert np.allclose(out, expected, atol=1e-9)
+
+
+def test_axis_aligned_sweep_matches_general_rotation() -> None:
+    import numpy as np
+
+    from convert_asset.camera import orbit
+
+    rows = np.array([[3.0, -1.0, 0.5], [0.2, 0.4, -2.0]])
+    thetas = np.linspace(0.0, 5.0, 6)
+    tilted = orbit._normalize_rows(np.array([0.0, 1e-3, 1.0]))
+    for up in (np.array([0.0, 0.0, 1.0]), np.array([0.0, -1.0, 0.0]), tilted):
+        swept = orbit._sweep_about_up(rows, up, np.cos(thetas), np.sin(thetas))
+        for s, theta in enumerate(thetas):
+            expected = orbit._rotate_rows(rows, up, np.cos(theta), np.sin(theta))
+            assert np.allclose(swept[:, s, :], expected, atol=1e-12)
+
+
+def test_bbox_keeps_nested_xform_meshes_next_to_loose_meshes() -> None:
+    from convert_asset.camera.orbit import _bbox_center_and_size
+
+    # Parent Xform bounds take part in the outlier statistics; without them the two big
+    # nested cubes would be rejected as outliers against the three small loose ones.
+    stage = Usd.Stage.CreateInMemory()
+    UsdGeom.Xform.Define(stage, "/W")
+    for i, x in enumerate((0.0, 10.0)):
+        xf = UsdGeom.Xform.Define(stage, f"/W/Xb{i}")
+        xf.AddTranslateOp().Set(Gf.Vec3d(x, 0.0, 0.0))
+        UsdGeom.Cube.Define(stage, f"/W/Xb{i}/C").CreateSizeAttr(8.0)
+    for i in range(3):
+        cube = UsdGeom.Cube.Define(stage, f"/W/s{i}")
+        cube.CreateSizeAttr(0.2)
+        cube.AddTranslateOp().Set(Gf.Vec3d(0.0, 3.0 * i, 0.0))
+
+    _, size = _bbox_center_and_size(stage, "/W")
+
+    assert Gf.IsClose(size, Gf.Vec3d(18.0, 10.1, 8.0), 1e-6)
@@ -204,6 +204,147 @@ def Xform "World"
             glb_stats = self._export_and_compare(usd_path)
             self.assertGreaterEqual(glb_stats["transform_nodes"], 2)
 
+    def test_zup_synthetic_root_matrix_is_exact_axis_swizzle(self):
+        fixture = """#usda 1.0
+(
+    upAxis = "Z"
+)
+
+def Mesh "Tri"
+{
+    int[] faceVertexCounts = [3]
+    int[] faceVertexIndices = [0, 1, 2]
+    point3f[] points = [(0, 0, 0), (1, 0, 0), (0, 1, 0)]
+}
+"""
+        with tempfile.TemporaryDirectory(prefix="glb_fixture_") as tmp_dir:
+            usd_path = Path(tmp_dir) / "fixture.usda"
+            out = Path(tmp_dir) / "out.glb"
+            usd_path.write_text(fixture, encoding="utf-8")
+            _export_glb(usd_path, out)
+            root = _load_gltf_json(out)["nodes"][0]
+            self.assertEqual(root["name"], "__RootTransform__")
+            # (x, y, z) -> (x, z, -y) with no floating-point residue from a generic rotation
+            self.assertEqual(root["matrix"], [1.0, 0.0, 0.0, 0.0, 0.0, 0.0, -1.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0])
+
+    def test_shared_textured_material_is_exported_once(self):
+        from PIL import Image
+
+        mesh_defs = "".join(
+            f"""
+    def Mesh "Tri{i}" (
+        prepend apiSchemas = ["MaterialBindingAPI"]
+    )
+    {{
+        int[] faceVertexCounts = [3]
+        int[] faceVertexIndices = [0, 1, 2]
+        point3f[] points = [(0, 0, 0), (1, 0, 0), (0, 1, 0)]
+        rel material:binding = </World/Looks/M>
+    }}
+"""
+            for i in range(3)
+        )
+        fixture = f"""#usda 1.0
+
+def Xform "World"
+{{
+    def Scope "Looks"
+    {{
+        def Material "M"
+        {{
+            token outputs:surface.connect = </World/Looks/M/PS.outputs:surface>
+
+            def Shader "PS"
+            {{
+                uniform token info:id = "UsdPreviewSurface"
+                color3f inputs:diffuseColor.connect = </World/Looks/M/Tex.outputs:rgb>
+                float inputs:roughness.connect = </World/Looks/M/Tex.outputs:r>
+                token outputs:surface
+            }}
+
+            def Shader "Tex"
+            {{
+                uniform token info:id = "UsdUVTexture"
+                asset inputs:file = @tex.png@
+                float3 outputs:rgb
+                float outputs:r
+            }}
+        }}
+    }}
+{mesh_defs}}}
+"""
+        with tempfile.TemporaryDirectory(prefix="glb_fixture_") as tmp_dir:
+            usd_path = Path(tmp_dir) / "fixture.usda"
+            out = Path(tmp_dir) / "out.glb"
+            usd_path.write_text(fixture, encoding="utf-8")
+            Image.new("RGB", (4, 4), (10, 20, 30)).save(Path(tmp_dir) / "tex.png")
+            _export_glb(usd_path, out)
+            gltf = _load_gltf_json(out)
+            self.assertEqual(len(gltf["meshes"]), 3)
+            self.assertEqual({m["primitives"][0]["material"] for m in gltf["meshes"]}, {0})
+            self.assertEqual(len(gltf["materials"]), 1)
+            self.assertEqual(len(gltf["textures"]), 2)
+
+    def test_identical_texture_files_share_one_image(self):
+        from PIL import Image
+
+        def material(name, tex):
+            return f"""
+        def Material "{name}"
+        {{
+            token outputs:surface.connect = </World/Looks/{name}/PS.outputs:surface>
+
+            def Shader "PS"
+            {{
+                uniform token info:id = "UsdPreviewSurface"
+                color3f inputs:diffuseColor.connect = </World/Looks/{name}/Tex.outputs:rgb>
+                token outputs:surface
+            }}
+
+            def Shader "Tex"
+            {{
+                uniform token info:id = "UsdUVTexture"
+                asset inputs:file = @{tex}@
+                float3 outputs:rgb
+            }}
+        }}
+"""
+
+        def mesh(name, mat):
+            return f"""
+    def Mesh "{name}" (
+        prepend apiSchemas = ["MaterialBindingAPI"]
+    )
+    {{
+        int[] faceVertexCounts = [3]
+        int[] faceVertexIndices = [0, 1, 2]
+        point3f[] points = [(0, 0, 0), (1, 0, 0), (0, 1, 0)]
+        rel material:binding = </World/Looks/{mat}>
+    }}
+"""
+
+        fixture = (
+            '#usda 1.0\n\ndef Xform "World"\n{\n    def Scope "Looks"\n    {'
+            + material("A", "tex.png")
+            + material("B", "./tex.png")
+            + material("C", "copy.png")
+            + "    }\n"
+            + mesh("TriA", "A")
+            + mesh("TriB", "B")
+            + mesh("TriC", "C")
+            + "}\n"
+        )
+        with tempfile.TemporaryDirectory(prefix="glb_fixture_") as tmp_dir:
+            usd_path = Path(tmp_dir) / "fixture.usda"
+            out = Path(tmp_dir) / "out.glb"
+            usd_path.write_text(fixture, encoding="utf-8")
+            Image.new("RGB", (4, 4), (10, 20, 30)).save(Path(tmp_dir) / "tex.png")
+            (Path(tmp_dir) / "copy.png").write_bytes((Path(tmp_dir) / "tex.png").read_bytes())
+            _export_glb(usd_path, out)
+            gltf = _load_gltf_json(out)
+            self.assertEqual(len(gltf["textures"]), 3)
+            self.assertEqual(len(gltf["images"]), 1)
+
     def test_articulated_direct_export_preserves_bbox(self):
         src = REPO_ROOT / "assets/usd/chestofdrawers_nomdl/chestofdrawers_0004/instance_noMDL.usd"
         glb_stats = self._export_and_compare(src)
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""Headless regressions for GLB texture encoding."""
+from __future__ import annotations
+
+import tempfile
+import unittest
+from io import BytesIO
+from pathlib import Path
+
+from PIL import Image
+
+from convert_asset.glb.texture_utils import process_texture
+
+
+class ProcessTextureTests(unittest.TestCase):
+    def test_rgb_png_and_jpeg_pass_through_unchanged(self):
+        with tempfile.TemporaryDirectory(prefix="glb_tex_") as tmp_dir:
+            png = Path(tmp_dir) / "a.png"
+            jpg = Path(tmp_dir) / "a.jpg"
+            Image.new("RGBA", (4, 4), (10, 20, 30, 40)).save(png)
+            Image.new("RGB", (4, 4), (10, 20, 30)).save(jpg)
+            self.assertEqual(process_texture(str(png)), (png.read_bytes(), "image/png"))
+            self.assertEqual(process_texture(str(jpg)), (jpg.read_bytes(), "image/jpeg"))
+
+    def test_non_rgb_modes_are_reencoded_as_rgb_png(self):
+        with tempfile.TemporaryDirectory(prefix="glb_tex_") as tmp_dir:
+            gray = Path(tmp_dir) / "g.png"
+            Image.new("L", (4, 4), 77).save(gray)
+            data, mime = process_texture(str(gray))
+            self.assertEqual(mime, "image/png")
+            with Image.open(BytesIO(data)) as img:
+                self.assertEqual(img.mode, "RGB")
+                self.assertEqual(img.getpixel((0, 0)), (77, 77, 77))
+
+    def test_truncated_png_and_jpeg_are_skipped(self):
+        with tempfile.TemporaryDirectory(prefix="glb_tex_") as tmp_dir:
+            for name, fmt in (("t.png", "PNG"), ("t.jpg", "JPEG")):
+                path = Path(tmp_dir) / name
+                buf = BytesIO()
+                Image.new("RGB", (64, 64), (10, 20, 30)).save(buf, format=fmt)
+                path.write_bytes(buf.getvalue()[:60])
+                self.assertIsNone(process_texture(str(path)))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""Headless regressions for the optional meshoptimizer pass in usd_mesh."""
+from __future__ import annotations
+
+import types
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from convert_asset.glb import usd_mesh
+from convert_asset.glb.usd_mesh import optimize_mesh_for_gpu
+
+
+def _fake_meshopt(calls):
+    """Stand-in with the meshoptimizer 0.2 signatures: reverses triangle order, remaps by first use."""
+
+    def optimize_vertex_cache(dest, indices, index_count, vertex_count):
+        calls.append("optimize_vertex_cache")
+        dest[:] = indices.reshape(-1, 3)[::-1].reshape(-1)
+
+    def optimize_vertex_fetch_remap(dest_remap, indices, index_count, vertex_count):
+        calls.append("optimize_vertex_fetch_remap")
+        dest_remap[:] = 0xFFFFFFFF
+        unique = 0
+        for i in indices:
+            if dest_remap[i] == 0xFFFFFFFF:
+                dest_remap[i] = unique
+                unique += 1
+        return unique
+
+    return types.SimpleNamespace(
+        optimize_vertex_cache=optimize_vertex_cache,
+        optimize_vertex_fetch_remap=optimize_vertex_fetch_remap,
+    )
+
+
+def _mesh_data(n_verts=6):
+    # 顶点 5 不被任何三角形引用
+    positions = np.arange(n_verts * 3, dtype=np.float32).reshape(n_verts, 3)
+    normals = positions[:, ::-1] * 0.5
+    uvs = positions[:, :2] * 0.25
+    indices = np.array([0, 1, 2, 2, 1, 3, 3, 4, 0], dtype=np.uint32)
+    return {"positions": positions, "normals": normals, "uvs": uvs, "indices": indices}
+
+
+def _triangle_soup(mesh_data, key):
+    corners = mesh_data[key][mesh_data["indices"]].reshape(-1, 3, mesh_data[key].shape[1])
+    return sorted(tuple(map(tuple, tri.tolist())) for tri in corners)
+
+
+class OptimizeMeshForGpuTests(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        patcher = mock.patch.object(usd_mesh, "_meshopt", _fake_meshopt(self.calls))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_reorder_keeps_triangle_soup_and_drops_unused_vertices(self):
+        data = _mesh_data()
+        out = optimize_mesh_for_gpu(data)
+        self.assertEqual(self.calls, ["optimize_vertex_cache", "optimize_vertex_fetch_remap"])
+        self.assertEqual(len(out["positions"]), 5)
+        self.assertEqual(out["indices"].tolist(), [0, 1, 2, 3, 4, 0, 2, 4, 3])
+        for key in ("positions", "normals", "uvs"):
+            self.assertEqual(len(out[key]), 5)
+            self.assertEqual(_triangle_soup(out, key), _triangle_soup(data, key))
+
+    def test_mismatched_uvs_are_left_alone(self):
+        data = _mesh_data()
+        data["uvs"] = np.zeros((4, 2), dtype=np.float32)
+        out = optimize_mesh_for_gpu(data)
+        self.assertIs(out["uvs"], data["uvs"])
+        self.assertEqual(_triangle_soup(out, "positions"), _triangle_soup(data, "positions"))
+
+    def test_out_of_range_indices_skip_the_extension(self):
+        data = _mesh_data()
+        data["indices"] = np.array([0, 1, 2, 2, 1, 6], dtype=np.uint32)
+        self.assertIs(optimize_mesh_for_gpu(data), data)
+        data["indices"] = np.array([0, 1, -1], dtype=np.int64)
+        self.assertIs(optimize_mesh_for_gpu(data), data)
+        self.assertEqual(self.calls, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -87,6 +87,28 @@ def test_normalize_asset_dry_run_writes_manifest_without_package_contents(
     assert manifest["blocked_reasons"] == []
 
 
+def test_top_level_help_lists_normalize_asset_like_full_parser(capsys) -> None:
+    assert main(["--help"]) == 0
+    fast = capsys.readouterr().out
+
+    # A leading unknown flag skips the fast path, so every subparser is built.
+    with pytest.raises(SystemExit):
+        main(["-x", "--help"])
+    full = capsys.readouterr().out
+
+    assert "normalize-asset" in fast
+    assert fast == full
+
+
+@pytest.mark.parametrize("argv", [["--help", "mesh-faces"], ["-h", "no-mdl"]])
+def test_help_before_subcommand_prints_full_top_level_help(capsys, argv) -> None:
+    assert main(["--help"]) == 0
+    fast = capsys.readouterr().out
+
+    assert main(argv) == 0
+    assert capsys.readouterr().out == fast
+
+
 def test_normalize_asset_rejects_non_usd_input_without_manifest(
     tmp_path: Path,
 ) -> None:
@@ -0,0 +1,34 @@
+from pathlib import Path
+
+from pxr import Sdf, Usd, UsdShade
+
+from convert_asset.export_mdl_materials import export_from_stage
+
+
+def _write_stage(path: Path) -> Usd.Stage:
+    stage = Usd.Stage.CreateNew(str(path))
+    for mat_path in ("/World/Looks/A", "/World/Looks/B", "/World/Other/C"):
+        mat = UsdShade.Material.Define(stage, mat_path)
+        shader = UsdShade.Shader.Define(stage, f"{mat_path}/Shader")
+        shader.GetPrim().CreateAttribute("info:mdl:sourceAsset", Sdf.ValueTypeNames.Asset).Set(Sdf.AssetPath("m.mdl"))
+        mat.CreateSurfaceOutput("mdl").ConnectToSource(shader.ConnectableAPI(), "out")
+    stage.GetRootLayer().Save()
+    return stage
+
+
+def test_material_roots_limit_search_to_given_subtrees(tmp_path):
+    stage = _write_stage(tmp_path / "scene.usda")
+
+    results = export_from_stage(stage, material_roots=["/World/Looks", "/Missing"])
+
+    assert [m for m, _ in results] == ["/World/Looks/A", "/World/Looks/B"]
+    assert (tmp_path / "mdl_materials" / "A.usda").exists()
+    assert not (tmp_path / "mdl_materials" / "C.usda").exists()
+
+
+def test_overlapping_material_roots_export_each_material_once(tmp_path):
+    stage = _write_stage(tmp_path / "scene.usda")
+
+    results = export_from_stage(stage, material_roots=["/World/Looks", "/World", "/World/Looks/A", "/World"])
+
+    assert [m for m, _ in results] == ["/World/Looks/A", "/World/Looks/B", "/World/Other/C"]